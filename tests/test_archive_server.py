@@ -0,0 +1,180 @@
+"""Tests for the transcript archive browser server."""
+
+from __future__ import annotations
+
+import http.client
+import os
+import socket
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+from whisperflow.archive_server import start_archive_server
+
+
+def _fetch(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=2) as response:
+        return response.read()
+
+
+def test_archive_server_serves_files_from_worker_pool(tmp_path: Path) -> None:
+    (tmp_path / "final.txt").write_text("hello archive", encoding="utf-8")
+    stop_event = threading.Event()
+    server = start_archive_server(tmp_path, stop_event, "127.0.0.1", 0, thread_pool=2)
+
+    host, port = server.server_address[:2]
+    try:
+        bodies = [_fetch(f"http://{host}:{port}/final.txt") for _ in range(4)]
+        listing = _fetch(f"http://{host}:{port}/")
+    finally:
+        stop_event.set()
+        server.server_close()
+
+    assert bodies == [b"hello archive"] * 4
+    assert b"final.txt" in listing
+    assert server._pool._max_workers == 2
+
+
+def test_archive_server_keeps_connection_alive(tmp_path: Path) -> None:
+    payload = b"x" * 100_000
+    (tmp_path / "raw.txt").write_bytes(payload)
+    (tmp_path / "final.txt").write_text("done", encoding="utf-8")
+    stop_event = threading.Event()
+    server = start_archive_server(tmp_path, stop_event, "127.0.0.1", 0)
+
+    host, port = server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=2)
+    try:
+        connection.request("GET", "/raw.txt")
+        raw = connection.getresponse().read()
+        sock = connection.sock
+        connection.request("GET", "/final.txt")
+        final = connection.getresponse().read()
+        reused = connection.sock is sock
+    finally:
+        connection.close()
+        stop_event.set()
+        server.server_close()
+
+    assert raw == payload
+    assert final == b"done"
+    assert reused
+
+
+def test_archive_server_answers_conditional_requests(tmp_path: Path) -> None:
+    (tmp_path / "final.txt").write_text("cached", encoding="utf-8")
+    stop_event = threading.Event()
+    server = start_archive_server(tmp_path, stop_event, "127.0.0.1", 0)
+
+    host, port = server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=2)
+    try:
+        connection.request("GET", "/final.txt")
+        first = connection.getresponse()
+        body = first.read()
+        etag = first.getheader("ETag")
+        connection.request("GET", "/final.txt", headers={"If-None-Match": etag})
+        second = connection.getresponse()
+        second.read()
+    finally:
+        connection.close()
+        stop_event.set()
+        server.server_close()
+
+    assert body == b"cached"
+    assert etag
+    assert first.getheader("Cache-Control") == "max-age=60"
+    assert second.status == 304
+    assert second.getheader("ETag") == etag
+
+
+def _count_listdir(monkeypatch) -> list[str]:
+    calls: list[str] = []
+    listdir = os.listdir
+
+    def counting_listdir(path):  # noqa: ANN001
+        calls.append(os.fspath(path))
+        return listdir(path)
+
+    monkeypatch.setattr(os, "listdir", counting_listdir)
+    return calls
+
+
+def test_archive_server_caches_directory_listing(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "first.txt").write_text("1", encoding="utf-8")
+    settled_ns = time.time_ns() - 60_000_000_000
+    os.utime(tmp_path, ns=(settled_ns, settled_ns))
+    listdir_calls = _count_listdir(monkeypatch)
+    stop_event = threading.Event()
+    server = start_archive_server(tmp_path, stop_event, "127.0.0.1", 0)
+
+    host, port = server.server_address[:2]
+    try:
+        first = _fetch(f"http://{host}:{port}/")
+        second = _fetch(f"http://{host}:{port}/")
+        cached_calls = len(listdir_calls)
+        (tmp_path / "second.txt").write_text("2", encoding="utf-8")
+        os.utime(tmp_path, ns=(settled_ns, settled_ns + 1))
+        third = _fetch(f"http://{host}:{port}/")
+    finally:
+        stop_event.set()
+        server.server_close()
+
+    assert cached_calls == 1
+    assert first == second
+    assert b"second.txt" in third
+    assert len(listdir_calls) == 2
+
+
+def test_archive_server_skips_cache_for_fresh_directory(
+    tmp_path: Path, monkeypatch
+) -> None:
+    (tmp_path / "first.txt").write_text("1", encoding="utf-8")
+    listdir_calls = _count_listdir(monkeypatch)
+    stop_event = threading.Event()
+    server = start_archive_server(tmp_path, stop_event, "127.0.0.1", 0)
+
+    host, port = server.server_address[:2]
+    try:
+        _fetch(f"http://{host}:{port}/")
+        mtime_ns = os.stat(tmp_path).st_mtime_ns
+        (tmp_path / "second.txt").write_text("2", encoding="utf-8")
+        # Same-tick change on a coarse-timestamp filesystem: the mtime stays put.
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        listing = _fetch(f"http://{host}:{port}/")
+    finally:
+        stop_event.set()
+        server.server_close()
+
+    assert b"second.txt" in listing
+    assert len(listdir_calls) == 2
+
+
+def test_archive_server_closes_queued_requests_on_close(tmp_path: Path) -> None:
+    stop_event = threading.Event()
+    server = start_archive_server(tmp_path, stop_event, "127.0.0.1", 0, thread_pool=1)
+    closed: list[object] = []
+    shutdown_request = server.shutdown_request
+
+    def record_shutdown(request):  # noqa: ANN001
+        closed.append(request)
+        shutdown_request(request)
+
+    server.shutdown_request = record_shutdown  # type: ignore[method-assign]
+
+    address = server.server_address[:2]
+    idle = socket.create_connection(address, timeout=2)
+    queued = socket.create_connection(address, timeout=2)
+    try:
+        queued.sendall(b"GET / HTTP/1.1\r\nHost: x\r\n\r\n")
+        # The idle connection holds the only worker, so the second one is queued.
+        time.sleep(0.2)
+        stop_event.set()
+        server.server_close()
+
+        assert len(closed) == 1
+        assert queued.recv(1) == b""
+    finally:
+        idle.close()
+        queued.close()
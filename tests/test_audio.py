@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+import threading
 import types
 
 import pytest
@@ -10,6 +12,25 @@ from whisperflow import audio
 from whisperflow.errors import WhisperflowRuntimeError
 
 
+@pytest.fixture(autouse=True)
+def _reset_audio_caches():
+    audio._reset_backend_cache()
+    audio._invalidate_audio_cache()
+    audio._query_cache_clear()
+    yield
+    audio._reset_backend_cache()
+    audio._invalidate_audio_cache()
+    audio._query_cache_clear()
+
+
+class FakePoll:
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    def poll(self, _timeout=None):  # noqa: ANN001
+        return [(self._fd, audio.select.POLLIN)]
+
+
 class FakeStream:
     def __init__(self) -> None:
         self.started = False
@@ -31,6 +52,25 @@ def test_resolve_backend_prefers_sounddevice(monkeypatch) -> None:
     assert audio._resolve_backend("auto") == "sounddevice"
 
 
+def test_resolve_backend_caches_auto_choice(monkeypatch) -> None:
+    calls = {"count": 0}
+
+    def available() -> bool:
+        calls["count"] += 1
+        return True
+
+    monkeypatch.setattr(audio, "_which", lambda name: None)
+    monkeypatch.setattr(audio, "_sounddevice_available", available)
+
+    assert audio._resolve_backend("auto") == "sounddevice"
+    assert audio._resolve_backend("auto") == "sounddevice"
+    assert calls["count"] == 1
+
+    audio._reset_backend_cache()
+    audio._resolve_backend("auto")
+    assert calls["count"] == 2
+
+
 def test_resolve_backend_missing_backends(monkeypatch) -> None:
     monkeypatch.setattr(audio, "_sounddevice_available", lambda: False)
     monkeypatch.setattr(audio.shutil, "which", lambda name: None)
@@ -58,6 +98,14 @@ def test_build_pw_record_command_with_target() -> None:
     assert "bluez_input.test" in command
 
 
+def test_build_commands_return_fresh_lists_from_cached_templates() -> None:
+    first = audio._build_pw_record_command(8000, 1)
+    first.append("--extra")
+    assert audio._build_pw_record_command(8000, 1)[-1] == "-"
+    assert audio._build_arecord_command(3, 16000, 1)[-2:] == ["-D", "plughw:3"]
+    assert audio._arecord_command(3, 16000, 1) is audio._arecord_command(3, 16000, 1)
+
+
 def test_sounddevice_capture_falls_back_on_sample_rate(monkeypatch) -> None:
     call_state = {"count": 0}
 
@@ -86,6 +134,76 @@ def test_sounddevice_capture_falls_back_on_sample_rate(monkeypatch) -> None:
     capture.stop()
 
 
+def test_sounddevice_capture_probes_rate_before_opening(monkeypatch) -> None:
+    opened = []
+
+    class FakePortAudioError(Exception):
+        pass
+
+    def fake_check_input_settings(**kwargs):
+        if kwargs["samplerate"] != 8000:
+            raise FakePortAudioError("bad rate")
+
+    def fake_input_stream(*_args, **kwargs):
+        opened.append(kwargs["samplerate"])
+        return FakeStream()
+
+    fake_module = types.SimpleNamespace(
+        InputStream=fake_input_stream,
+        PortAudioError=FakePortAudioError,
+        check_input_settings=fake_check_input_settings,
+    )
+
+    monkeypatch.setitem(__import__("sys").modules, "sounddevice", fake_module)
+    monkeypatch.setattr(audio, "_default_sounddevice_samplerate", lambda *_: 8000)
+
+    capture = audio._SoundDeviceCapture("default", 16000, 1, 100)
+    capture.start()
+
+    assert opened == [8000]
+    assert len(capture._slots[0]) == 800 * 2
+    capture.stop()
+
+
+def test_sounddevice_callback_drops_oldest_chunk_when_full(monkeypatch) -> None:
+    callbacks = []
+
+    def fake_input_stream(*_args, **kwargs):
+        callbacks.append(kwargs["callback"])
+        return FakeStream()
+
+    fake_module = types.SimpleNamespace(
+        InputStream=fake_input_stream, PortAudioError=Exception
+    )
+    monkeypatch.setitem(__import__("sys").modules, "sounddevice", fake_module)
+    monkeypatch.setattr(audio, "_SD_MAX_QUEUED_CHUNKS", 2)
+
+    capture = audio._SoundDeviceCapture("default", 16000, 1, 100)
+    capture.start()
+    for payload in (b"aa", b"bb", b"cc"):
+        callbacks[0](payload, 1, None, None)
+
+    assert capture.read(timeout=0).data == b"bb"
+    assert capture.read(timeout=0).data == b"cc"
+    assert capture.read(timeout=0) is None
+    capture.stop()
+
+
+def test_set_pipe_size_only_grows_pipe() -> None:
+    if not hasattr(audio.fcntl, "F_GETPIPE_SZ"):
+        pytest.skip("pipe resizing is Linux-only")
+    read_fd, write_fd = audio.os.pipe()
+    try:
+        initial = audio.fcntl.fcntl(read_fd, audio.fcntl.F_GETPIPE_SZ)
+        audio._set_pipe_size(read_fd, 1024)
+        assert audio.fcntl.fcntl(read_fd, audio.fcntl.F_GETPIPE_SZ) == initial
+        audio._set_pipe_size(read_fd, initial * 2)
+        assert audio.fcntl.fcntl(read_fd, audio.fcntl.F_GETPIPE_SZ) >= initial * 2
+    finally:
+        audio.os.close(read_fd)
+        audio.os.close(write_fd)
+
+
 def test_subprocess_capture_reads_audio(monkeypatch) -> None:
     class FakeStdout:
         def fileno(self) -> int:
@@ -108,29 +226,121 @@ def test_subprocess_capture_reads_audio(monkeypatch) -> None:
     capture = audio._SubprocessCapture(["cmd"], 1000, 1, 100)
     capture._process = FakeProcess()  # type: ignore[assignment]
     capture._stdout_fd = 3
+    capture._poll = FakePoll(3)  # type: ignore[assignment]
+
+    reads: list[int] = []
+
+    def fake_readv(_fd, buffers):  # noqa: ANN001
+        view = buffers[0]
+        count = min(len(view), capture._chunk_bytes // 2)
+        view[:count] = b"0" * count
+        reads.append(count)
+        return count
 
-    monkeypatch.setattr(audio.select, "select", lambda *_: ([3], [], []))
-    monkeypatch.setattr(audio.os, "read", lambda *_: b"0" * capture._chunk_bytes)
+    monkeypatch.setattr(audio.os, "readv", fake_readv)
 
     chunk = capture.read(timeout=0.1)
     assert chunk is not None
-    assert len(chunk.data) == capture._chunk_bytes
+    assert chunk.data == b"0" * capture._chunk_bytes
+    assert len(reads) == 2
     capture.stop()
 
 
+def test_subprocess_capture_batches_backlog_into_one_readv(monkeypatch) -> None:
+    class FakeProcess:
+        stdout = object()
+        stderr = None
+
+        def poll(self) -> None:
+            return None
+
+    read_fd, write_fd = audio.os.pipe()
+    capture = audio._SubprocessCapture(["cmd"], 1000, 1, 100)
+    capture._process = FakeProcess()  # type: ignore[assignment]
+    capture._stdout_fd = read_fd
+    capture._poll = audio.select.poll()
+    capture._poll.register(read_fd, audio.select.POLLIN)
+    chunk_bytes = capture._chunk_bytes
+    payload = bytes(range(256)) * (chunk_bytes * 5 // 2 // 256 + 1)
+    payload = payload[: chunk_bytes * 5 // 2]
+
+    calls = {"count": 0}
+    real_readv = audio.os.readv
+
+    def counting_readv(fd, buffers):  # noqa: ANN001
+        calls["count"] += 1
+        return real_readv(fd, buffers)
+
+    monkeypatch.setattr(audio.os, "readv", counting_readv)
+    audio.os.set_blocking(read_fd, False)
+    try:
+        audio.os.write(write_fd, payload)
+        first = capture.read(timeout=1)
+        second = capture.read(timeout=1)
+        batched_calls = calls["count"]
+        third = capture.read(timeout=0)
+    finally:
+        audio.os.close(read_fd)
+        audio.os.close(write_fd)
+
+    assert batched_calls == 1
+    assert bytes(first.data) == payload[:chunk_bytes]
+    assert bytes(second.data) == payload[chunk_bytes : chunk_bytes * 2]
+    assert third is None
+    assert capture._filled == chunk_bytes // 2
+
+
+def test_subprocess_capture_polls_only_when_pipe_is_empty(monkeypatch) -> None:
+    class FakeProcess:
+        stdout = object()
+        stderr = None
+
+        def poll(self) -> None:
+            return None
+
+    class EmptyPoll:
+        calls = 0
+
+        def poll(self, _timeout=None):  # noqa: ANN001
+            EmptyPoll.calls += 1
+            return []
+
+    def empty_readv(_fd, _buffers):  # noqa: ANN001
+        raise BlockingIOError
+
+    capture = audio._SubprocessCapture(["cmd"], 1000, 1, 100)
+    capture._process = FakeProcess()  # type: ignore[assignment]
+    capture._stdout_fd = 3
+    capture._poll = EmptyPoll()  # type: ignore[assignment]
+    monkeypatch.setattr(audio.os, "readv", empty_readv)
+
+    assert capture.read(timeout=0) is None
+    assert EmptyPoll.calls == 1
+
+
+def test_subprocess_capture_release_recycles_buffer() -> None:
+    first = audio._SubprocessCapture(["cmd"], 1234, 1, 100)
+    second = audio._SubprocessCapture(["cmd"], 1234, 1, 100)
+    assert first._pool is second._pool
+
+    buffer = first._pool.acquire()
+    data = memoryview(buffer).toreadonly()
+    first.release(data)
+
+    assert second._pool.acquire() is buffer
+    with pytest.raises(ValueError):
+        bytes(data)
+
+
 def test_subprocess_capture_reports_exit(monkeypatch) -> None:
     class FakeStdout:
         def fileno(self) -> int:
             return 3
 
-    class FakeStderr:
-        def read(self) -> bytes:
-            return b"boom"
-
     class FakeProcess:
         def __init__(self) -> None:
             self.stdout = FakeStdout()
-            self.stderr = FakeStderr()
+            self.stderr = None
 
         def poll(self) -> int:
             return 1
@@ -138,11 +348,22 @@ def test_subprocess_capture_reports_exit(monkeypatch) -> None:
     capture = audio._SubprocessCapture(["cmd"], 1000, 1, 100)
     capture._process = FakeProcess()  # type: ignore[assignment]
     capture._stdout_fd = 3
+    capture._stderr_tail.append(b"boom\n")
 
     with pytest.raises(WhisperflowRuntimeError, match="boom"):
         capture.read(timeout=0.1)
 
 
+def test_drain_lines_keeps_stderr_tail() -> None:
+    stream = io.BytesIO(b"".join(b"line %d\n" % index for index in range(100)))
+    tail = audio.deque(maxlen=audio._STDERR_TAIL_LINES)
+
+    audio._drain_lines(stream, tail)
+
+    assert len(tail) == audio._STDERR_TAIL_LINES
+    assert tail[-1] == b"line 99\n"
+
+
 def test_subprocess_start_missing_executable(monkeypatch) -> None:
     def raise_error(*_args, **_kwargs):
         raise FileNotFoundError("missing")
@@ -169,7 +390,10 @@ def test_open_audio_capture_arecord(monkeypatch) -> None:
 def test_open_audio_capture_pw_record(monkeypatch) -> None:
     capture_instance = object()
     monkeypatch.setattr(audio, "_resolve_backend", lambda *_: "pw-record")
-    monkeypatch.setattr(audio, "_build_pw_record_command", lambda *_: ["pw-record"])
+    monkeypatch.setattr(audio, "_resolve_pw_target_source", lambda: None)
+    monkeypatch.setattr(
+        audio, "_build_pw_record_command", lambda *_args, **_kwargs: ["pw-record"]
+    )
     monkeypatch.setattr(
         audio, "_SubprocessCapture", lambda *_args, **_kwargs: capture_instance
     )
@@ -227,11 +451,43 @@ def test_resolve_backend_requested_backend_missing(monkeypatch) -> None:
         audio._resolve_backend("arecord")
 
 
+def test_which_is_cached_per_path(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_which(name: str) -> str:
+        calls.append(name)
+        return f"/usr/bin/{name}"
+
+    monkeypatch.setattr(audio.shutil, "which", fake_which)
+    monkeypatch.setenv("PATH", "/usr/bin")
+    assert audio._which("arecord") == "/usr/bin/arecord"
+    assert audio._which("arecord") == "/usr/bin/arecord"
+    assert calls == ["arecord"]
+
+    monkeypatch.setenv("PATH", "/usr/local/bin:/usr/bin")
+    audio._which("arecord")
+    assert calls == ["arecord", "arecord"]
+
+
 def test_sounddevice_available_true(monkeypatch) -> None:
     monkeypatch.setitem(__import__("sys").modules, "sounddevice", object())
     assert audio._sounddevice_available() is True
 
 
+def test_sounddevice_module_is_cached_until_invalidated(monkeypatch) -> None:
+    first = types.SimpleNamespace()
+    second = types.SimpleNamespace()
+    modules = __import__("sys").modules
+    monkeypatch.setitem(modules, "sounddevice", first)
+    assert audio._sounddevice() is first
+
+    monkeypatch.setitem(modules, "sounddevice", second)
+    assert audio._sounddevice() is first
+
+    audio._invalidate_audio_cache()
+    assert audio._sounddevice() is second
+
+
 def test_default_sounddevice_samplerate(monkeypatch) -> None:
     class FakePortAudioError(Exception):
         pass
@@ -255,13 +511,51 @@ def test_default_sounddevice_samplerate(monkeypatch) -> None:
     assert audio._default_sounddevice_samplerate(ErrorModule, None) is None
 
 
+def test_default_sounddevice_samplerate_is_cached() -> None:
+    calls = {"count": 0}
+
+    class FakePortAudioError(Exception):
+        pass
+
+    class FakeModule:
+        PortAudioError = FakePortAudioError
+
+        @staticmethod
+        def query_devices(_device, _kind):
+            calls["count"] += 1
+            return {"default_samplerate": 48000}
+
+    assert audio._default_sounddevice_samplerate(FakeModule, 3) == 48000
+    assert audio._default_sounddevice_samplerate(FakeModule, 3) == 48000
+    assert calls["count"] == 1
+
+    audio._invalidate_audio_cache()
+    assert audio._default_sounddevice_samplerate(FakeModule, 3) == 48000
+    assert calls["count"] == 2
+
+
 def test_sounddevice_capture_read_queue(monkeypatch) -> None:
     capture = audio._SoundDeviceCapture("default", 16000, 1, 100)
     assert capture.read(timeout=0.0) is None
-    capture._queue.put(b"1234")
+    capture._allocate_slots(2)
+    capture._push(memoryview(b"1234"))
+    capture._push(memoryview(b"567"))
     chunk = capture.read(timeout=0.0)
     assert chunk is not None
     assert chunk.data == b"1234"
+    assert capture.read(timeout=0.0).data == b"567"
+    assert capture.read(timeout=0.0) is None
+
+
+def test_sounddevice_capture_read_wakes_on_push() -> None:
+    capture = audio._SoundDeviceCapture("default", 16000, 1, 100)
+    capture._allocate_slots(1)
+    timer = threading.Timer(0.05, capture._push, args=(memoryview(b"ab"),))
+    timer.start()
+    chunk = capture.read(timeout=2)
+    timer.join()
+    assert chunk is not None
+    assert chunk.data == b"ab"
 
 
 def test_subprocess_capture_read_without_process() -> None:
@@ -285,9 +579,8 @@ def test_subprocess_capture_returns_none_on_eof(monkeypatch) -> None:
     capture = audio._SubprocessCapture(["cmd"], 1000, 1, 100)
     capture._process = FakeProcess()  # type: ignore[assignment]
     capture._stdout_fd = 3
-
-    monkeypatch.setattr(audio.select, "select", lambda *_: ([3], [], []))
-    monkeypatch.setattr(audio.os, "read", lambda *_: b"")
+    capture._poll = FakePoll(3)  # type: ignore[assignment]
+    monkeypatch.setattr(audio.os, "readv", lambda *_: 0)
 
     assert capture.read(timeout=0.1) is None
 
@@ -298,19 +591,19 @@ def test_subprocess_capture_stop_without_process() -> None:
 
 
 def test_resolve_system_default_device_matches(monkeypatch) -> None:
-    def fake_run(args, capture_output, text, check):  # noqa: ANN001
+    def fake_run(args, capture_output, check):  # noqa: ANN001
         if args[:2] == ["pactl", "info"]:
             return types.SimpleNamespace(
-                returncode=0, stdout="Default Source: bluez_input.test\n"
+                returncode=0, stdout=b"Default Source: bluez_input.test\n"
             )
         return types.SimpleNamespace(
             returncode=0,
             stdout=(
-                "Source #1\n"
-                "\tName: bluez_input.test\n"
-                "\tDescription: HD 450SE\n"
-                "\tProperties:\n"
-                '\t\talsa.card_name = "HD 450SE"\n'
+                b"Source #1\n"
+                b"\tName: bluez_input.test\n"
+                b"\tDescription: HD 450SE\n"
+                b"\tProperties:\n"
+                b'\t\talsa.card_name = "HD 450SE"\n'
             ),
         )
 
@@ -327,6 +620,70 @@ def test_resolve_system_default_device_matches(monkeypatch) -> None:
     assert audio._resolve_system_default_device() == 0
 
 
+def test_pactl_output_is_cached(monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(args, **_kwargs):  # noqa: ANN001
+        calls.append(args)
+        return types.SimpleNamespace(
+            returncode=0, stdout=b"Default Source: mic\nDefault Sink: spk\n"
+        )
+
+    monkeypatch.setattr(audio.subprocess, "run", fake_run)
+
+    assert audio._pactl_default_source() == "mic"
+    assert audio._pactl_default_sink() == "spk"
+    assert calls == [["pactl", "info"]]
+
+    audio._query_cache_clear()
+    audio._pactl_default_source()
+    assert len(calls) == 2
+
+
+def test_parse_sources_maps_blocks_by_name() -> None:
+    output = (
+        b"Source #0\n"
+        b"\tName: alsa_input.pci\n"
+        b"\tDescription: Built-in Audio\n"
+        b"\tProperties:\n"
+        b'\t\talsa.card_name = "HDA Intel"\n'
+        b"Source #1\n"
+        b"\tName: bluez_input.test\n"
+        b"\tDescription: HD 450SE\n"
+        b"\tProperties:\n"
+        b'\t\tdevice.product.name = "HD 450SE BT"\n'
+    )
+
+    sources = audio._parse_sources(output)
+    assert sources["bluez_input.test"] == {
+        "description": "HD 450SE",
+        "product_name": "HD 450SE BT",
+    }
+    assert sources["alsa_input.pci"] == {
+        "description": "Built-in Audio",
+        "card_name": "HDA Intel",
+    }
+    assert "missing" not in sources
+
+
+def test_pactl_source_lookups_share_one_parsed_listing(monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(args, **_kwargs):  # noqa: ANN001
+        calls.append(args)
+        return types.SimpleNamespace(
+            returncode=0,
+            stdout=b"Source #1\n\tName: spk.monitor\n\tDescription: Speakers\n",
+        )
+
+    monkeypatch.setattr(audio.subprocess, "run", fake_run)
+
+    assert audio._pactl_has_source("spk.monitor")
+    assert not audio._pactl_has_source("mic")
+    assert audio._pactl_source_metadata("spk.monitor") == {"description": "Speakers"}
+    assert calls == [["pactl", "list", "sources"]]
+
+
 def test_resolve_system_default_device_without_pactl(monkeypatch) -> None:
     def raise_error(*_args, **_kwargs):
         raise OSError("missing pactl")
@@ -336,20 +693,20 @@ def test_resolve_system_default_device_without_pactl(monkeypatch) -> None:
 
 
 def test_resolve_system_default_output_device(monkeypatch) -> None:
-    def fake_run(args, capture_output, text, check):  # noqa: ANN001
+    def fake_run(args, capture_output, check):  # noqa: ANN001
         if args[:2] == ["pactl", "info"]:
             return types.SimpleNamespace(
                 returncode=0,
-                stdout="Default Sink: bluez_output.test\n",
+                stdout=b"Default Sink: bluez_output.test\n",
             )
         return types.SimpleNamespace(
             returncode=0,
             stdout=(
-                "Source #1\n"
-                "\tName: bluez_output.test.monitor\n"
-                "\tDescription: HD 450SE Monitor\n"
-                "\tProperties:\n"
-                '\t\tdevice.description = "HD 450SE"\n'
+                b"Source #1\n"
+                b"\tName: bluez_output.test.monitor\n"
+                b"\tDescription: HD 450SE Monitor\n"
+                b"\tProperties:\n"
+                b'\t\tdevice.description = "HD 450SE"\n'
             ),
         )
 
@@ -399,3 +756,41 @@ def test_open_output_capture_bluetooth_fallback(monkeypatch) -> None:
 
     result = audio.open_output_capture("sounddevice", "default", 16000, 1, 100)
     assert result is sentinel
+
+
+def test_normalize_and_tokenize_device_names() -> None:
+    assert audio._normalize_token("HD 450SE (Analog)") == "hd450seanalog"
+    assert audio._tokenize("HD 450SE - Analog in") == ["450se", "analog"]
+
+
+def test_score_device_match_uses_normalized_candidates() -> None:
+    score = audio._score_device_match(
+        ["hd450se", "bluezinputtest"], ["450se", "analog"], "hd450seanalog"
+    )
+    assert score == 5 + 1 + 1
+
+
+def test_parse_pactl_info_reads_defaults() -> None:
+    output = (
+        b"Server Name: PulseAudio (on PipeWire 1.0.5)\n"
+        b"Default Sink: alsa_output.pci  \n"
+        b"Default Source: alsa_input.pci\n"
+        b"Cookie: 1234\n"
+    )
+    assert audio._parse_pactl_info(output) == {
+        "default_sink": "alsa_output.pci",
+        "default_source": "alsa_input.pci",
+    }
+    assert audio._parse_pactl_info(b"Server Name: x\n") == {}
+
+
+def test_parse_pw_dump_indexes_node_serials() -> None:
+    output = (
+        b'[{"type": "PipeWire:Interface:Client", "info": {"props": {}}},'
+        b' {"type": "PipeWire:Interface:Node", "info": {"props": {'
+        b'"media.class": "Audio/Source", "node.name": "mic", "object.serial": 42}}},'
+        b' {"type": "PipeWire:Interface:Node", "info": {"props": {'
+        b'"media.class": "Audio/Sink", "node.name": "spk", "object.serial": "7"}}}]'
+    )
+    assert audio._parse_pw_dump(output) == {("Audio/Source", "mic"): 42}
+    assert audio._parse_pw_dump(b"not json") == {}
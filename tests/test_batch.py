@@ -0,0 +1,64 @@
+"""Tests for batch transcription."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from whisperflow import batch
+from whisperflow.config import clone_config
+from whisperflow.errors import WhisperflowRuntimeError
+
+
+def test_run_batch_merges_overrides_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ("b.wav", "a.mp3", "notes.txt"):
+        (tmp_path / name).write_bytes(b"fake")
+    (tmp_path / "nested.wav").mkdir()
+    calls: list[tuple[str, dict[str, Any], dict[str, Any]]] = []
+
+    def fake_transcribe(
+        input_path: str, config: dict[str, Any], overrides: dict[str, Any]
+    ) -> list[str]:
+        calls.append((input_path, config, overrides))
+        return [f"{input_path}.txt"]
+
+    monkeypatch.setattr(batch, "run_transcribe", fake_transcribe)
+
+    summary = batch.run_batch(str(tmp_path), clone_config(), {"model": "medium"})
+
+    assert [Path(call[0]).name for call in calls] == ["a.mp3", "b.wav"]
+    assert all(call[1]["model"] == "medium" for call in calls)
+    assert all(call[2] == {} for call in calls)
+    assert calls[0][1] is calls[1][1]
+    assert summary["skipped"] == [str(tmp_path / "notes.txt")]
+
+
+def test_run_batch_runs_workers_in_parallel(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ("a.wav", "b.wav", "c.wav"):
+        (tmp_path / name).write_bytes(b"fake")
+    barrier = threading.Barrier(3, timeout=2)
+
+    def fake_transcribe(
+        input_path: str, config: dict[str, Any], overrides: dict[str, Any]
+    ) -> list[str]:
+        barrier.wait()
+        if input_path.endswith("b.wav"):
+            raise WhisperflowRuntimeError("boom")
+        return [f"{input_path}.txt"]
+
+    monkeypatch.setattr(batch, "run_transcribe", fake_transcribe)
+
+    summary = batch.run_batch(str(tmp_path), clone_config({"batch_workers": 3}), {})
+
+    assert summary["successes"] == [
+        f"{tmp_path / 'a.wav'}.txt",
+        f"{tmp_path / 'c.wav'}.txt",
+    ]
+    assert summary["failures"] == [f"{tmp_path / 'b.wav'} (boom)"]
@@ -1,5 +1,8 @@
 """Tests for CLI argument parsing."""
 
+import subprocess
+import sys
+
 import pytest
 
 from whisperflow import cli
@@ -18,3 +21,15 @@ def test_parser_requires_command() -> None:
     with pytest.raises(SystemExit) as excinfo:
         parser.parse_args([])
     assert excinfo.value.code == 2
+
+
+def test_cli_import_does_not_load_capture_modules() -> None:
+    heavy = ("numpy", "sounddevice", "whisperflow.daemon", "whisperflow.transcribe")
+    script = (
+        "import sys, whisperflow.cli; "
+        f"print([name for name in {heavy!r} if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,102 @@
+"""Tests for clipboard helpers."""
+
+from __future__ import annotations
+
+import subprocess
+import types
+
+import pytest
+
+from whisperflow import clipboard
+
+
+@pytest.fixture(autouse=True)
+def _reset_clipboard_cache():
+    clipboard._reset_tool_cache()
+    yield
+    clipboard._reset_tool_cache()
+
+
+def _fake_which(installed: set[str], calls: list[str]):
+    def which(name: str) -> str | None:
+        calls.append(name)
+        return f"/usr/bin/{name}" if name in installed else None
+
+    return which
+
+
+def test_select_tool_prefers_order_and_caches(monkeypatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(
+        clipboard.shutil, "which", _fake_which({"xsel", "wl-copy"}, calls)
+    )
+
+    assert clipboard._select_tool("auto") == "xsel"
+    assert clipboard._select_tool("auto") == "xsel"
+    assert calls == ["xclip", "xsel"]
+    assert clipboard._select_tool("wl-copy") == "wl-copy"
+    assert clipboard._select_tool("pbcopy") is None
+
+
+def test_select_tool_picks_up_newly_installed_tool(monkeypatch) -> None:
+    installed: set[str] = set()
+    monkeypatch.setattr(clipboard.shutil, "which", _fake_which(installed, []))
+
+    assert clipboard._select_tool("auto") is None
+    installed.add("wl-copy")
+    assert clipboard._select_tool("auto") == "wl-copy"
+
+
+def test_select_tool_cache_follows_path(monkeypatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(clipboard.shutil, "which", _fake_which({"xclip"}, calls))
+    monkeypatch.setenv("PATH", "/usr/bin")
+    clipboard._select_tool("auto")
+    monkeypatch.setenv("PATH", "/usr/local/bin:/usr/bin")
+    clipboard._select_tool("auto")
+
+    assert calls == ["xclip", "xclip"]
+
+
+def test_copy_to_clipboard_forgets_removed_tool(monkeypatch) -> None:
+    installed = {"xclip", "xsel"}
+    monkeypatch.setattr(clipboard.shutil, "which", _fake_which(installed, []))
+    runs: list[list[str]] = []
+
+    def fake_run(command, **_kwargs):  # noqa: ANN001
+        runs.append(command)
+        if command[0] not in installed:
+            raise FileNotFoundError(command[0])
+        return types.SimpleNamespace(returncode=0, stderr=b"")
+
+    monkeypatch.setattr(clipboard.subprocess, "run", fake_run)
+
+    assert clipboard.copy_to_clipboard("hello") is True
+    installed.discard("xclip")
+    assert clipboard.copy_to_clipboard("hello") is False
+    assert clipboard.copy_to_clipboard("hello") is True
+    assert [command[0] for command in runs] == ["xclip", "xclip", "xsel"]
+
+
+def test_copy_to_clipboard_reports_failure(monkeypatch) -> None:
+    monkeypatch.setattr(clipboard.shutil, "which", _fake_which({"xclip"}, []))
+    monkeypatch.setattr(
+        clipboard.subprocess,
+        "run",
+        lambda *_args, **_kwargs: types.SimpleNamespace(
+            returncode=1, stderr=b"no display"
+        ),
+    )
+
+    assert clipboard.copy_to_clipboard("hello") is False
+
+
+def test_copy_to_clipboard_times_out(monkeypatch) -> None:
+    monkeypatch.setattr(clipboard.shutil, "which", _fake_which({"xclip"}, []))
+
+    def time_out(*_args, **_kwargs):
+        raise subprocess.TimeoutExpired("xclip", 2.0)
+
+    monkeypatch.setattr(clipboard.subprocess, "run", time_out)
+
+    assert clipboard.copy_to_clipboard("hello") is False
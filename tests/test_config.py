@@ -5,14 +5,20 @@ from pathlib import Path
 
 import pytest
 
-from whisperflow.config import DEFAULT_CONFIG, apply_overrides, load_config
+from whisperflow import config as config_module
+from whisperflow.config import (
+    DEFAULT_CONFIG,
+    apply_overrides,
+    clone_config,
+    load_config,
+)
 from whisperflow.errors import ConfigError
 
 
 def _override(
     base: dict[str, object], overrides: dict[str, object]
 ) -> dict[str, object]:
-    return apply_overrides(copy.deepcopy(base), overrides)
+    return apply_overrides(base, overrides)
 
 
 def test_bool_values_are_rejected_for_int_fields() -> None:
@@ -111,3 +117,57 @@ def test_logging_file_can_be_none() -> None:
     config = copy.deepcopy(DEFAULT_CONFIG)
     config["logging"]["file"] = None
     apply_overrides(config, {})
+
+
+def test_apply_overrides_copies_only_touched_branches() -> None:
+    merged = apply_overrides(
+        DEFAULT_CONFIG, {"live_capture": {"audio": {"sample_rate": 48000}}}
+    )
+
+    assert merged["live_capture"]["audio"]["sample_rate"] == 48000
+    assert DEFAULT_CONFIG["live_capture"]["audio"]["sample_rate"] == 16000
+    assert merged["live_capture"]["vad"] is DEFAULT_CONFIG["live_capture"]["vad"]
+
+
+def test_apply_overrides_without_overrides_shares_subtrees() -> None:
+    merged = apply_overrides(DEFAULT_CONFIG, None)
+
+    assert merged == DEFAULT_CONFIG
+    assert merged is not DEFAULT_CONFIG
+    assert merged["live_capture"] is DEFAULT_CONFIG["live_capture"]
+
+
+def test_clone_config_copies_overridden_branches() -> None:
+    config = clone_config({"live_capture": {"vad": {"enabled": False}}})
+    config["live_capture"]["vad"]["silence_ms"] = 1
+
+    assert config["live_capture"]["vad"]["enabled"] is False
+    assert DEFAULT_CONFIG["live_capture"]["vad"]["enabled"] is True
+    assert DEFAULT_CONFIG["live_capture"]["vad"]["silence_ms"] == 700
+
+
+@pytest.mark.skipif(
+    config_module._orjson_dumps is None, reason="validation cache needs orjson"
+)
+def test_apply_overrides_skips_revalidating_identical_configs(monkeypatch) -> None:
+    calls = {"count": 0}
+    validate = config_module._validate_config
+
+    def counting_validate(config: dict[str, object]) -> None:
+        calls["count"] += 1
+        validate(config)
+
+    monkeypatch.setattr(config_module, "_validate_config", counting_validate)
+    monkeypatch.setattr(config_module, "_VALIDATED", config_module.OrderedDict())
+
+    apply_overrides(DEFAULT_CONFIG, {"model": "medium"})
+    apply_overrides(DEFAULT_CONFIG, {"model": "medium"})
+    assert calls["count"] == 1
+
+    apply_overrides(DEFAULT_CONFIG, {"model": "large-v3"})
+    assert calls["count"] == 2
+
+    for _ in range(2):
+        with pytest.raises(ConfigError, match="model"):
+            apply_overrides(DEFAULT_CONFIG, {"model": "tiny"})
+    assert calls["count"] == 4
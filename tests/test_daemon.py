@@ -0,0 +1,225 @@
+"""Tests for daemon process helpers."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+from whisperflow import daemon
+
+
+def _capture_writes(monkeypatch) -> list[dict]:
+    writes: list[dict] = []
+    monkeypatch.setattr(
+        daemon, "_write_state", lambda state: writes.append(dict(state))
+    )
+    return writes
+
+
+def test_state_writer_coalesces_updates(monkeypatch) -> None:
+    writes = _capture_writes(monkeypatch)
+    state = {"count": 0}
+    lock = threading.Lock()
+    writer = daemon._StateWriter(state, lock, interval=0.05)
+
+    for count in range(1, 6):
+        with lock:
+            state["count"] = count
+        writer.mark_dirty()
+    time.sleep(0.2)
+    writer.close()
+
+    assert writes[0] == {"count": 5}
+    assert writes[-1] == {"count": 5}
+    assert len(writes) <= 2
+
+
+def test_state_writer_close_during_interval_flushes(monkeypatch) -> None:
+    writes = _capture_writes(monkeypatch)
+    state = {"status": "running"}
+    lock = threading.Lock()
+    writer = daemon._StateWriter(state, lock, interval=0.05)
+
+    writer.mark_dirty()
+    time.sleep(0.01)
+    with lock:
+        state["status"] = "stopped"
+    closer = threading.Thread(target=writer.close, daemon=True)
+    closer.start()
+    closer.join(timeout=2.0)
+
+    assert not closer.is_alive()
+    assert writes[-1] == {"status": "stopped"}
+
+
+class _Exited(Exception):
+    def __init__(self, code: int) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+def _stub_child_process(monkeypatch, tmp_path) -> list[tuple[int, int]]:
+    monkeypatch.setattr(daemon, "LOG_PATH", tmp_path / "daemon.log")
+    monkeypatch.setattr(daemon.os, "fork", lambda: 0)
+    monkeypatch.setattr(daemon.os, "setsid", lambda: None)
+    duplicated: list[tuple[int, int]] = []
+    monkeypatch.setattr(
+        daemon.os, "dup2", lambda fd, target: duplicated.append((fd, target))
+    )
+
+    def fake_exit(code: int) -> None:
+        raise _Exited(code)
+
+    monkeypatch.setattr(daemon.os, "_exit", fake_exit)
+    return duplicated
+
+
+def test_fork_daemon_child_exits_cleanly(monkeypatch, tmp_path) -> None:
+    duplicated = _stub_child_process(monkeypatch, tmp_path)
+    runs: list[object] = []
+    monkeypatch.setattr(daemon, "_run_daemon", runs.append)
+
+    with pytest.raises(_Exited) as exited:
+        daemon._fork_daemon()
+
+    assert exited.value.code == 0
+    assert runs == [daemon.CONFIG_PATH]
+    assert [target for _fd, target in duplicated] == [0, 1, 2]
+
+
+def test_fork_daemon_child_exits_nonzero_when_daemon_raises(
+    monkeypatch, tmp_path
+) -> None:
+    _stub_child_process(monkeypatch, tmp_path)
+
+    def crash(_config_path) -> None:  # noqa: ANN001
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(daemon, "_run_daemon", crash)
+
+    with pytest.raises(_Exited) as exited:
+        daemon._fork_daemon()
+
+    assert exited.value.code == 1
+
+
+def test_fork_daemon_parent_returns_child_pid(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(daemon, "LOG_PATH", tmp_path / "daemon.log")
+    monkeypatch.setattr(daemon.os, "fork", lambda: 4242)
+
+    assert daemon._fork_daemon() == 4242
+    assert (tmp_path / "daemon.log").exists()
+
+
+def test_read_pid_handles_missing_and_garbled_files(monkeypatch, tmp_path) -> None:
+    pid_path = tmp_path / "whisperflow.pid"
+    monkeypatch.setattr(daemon, "PID_PATH", pid_path)
+
+    assert daemon._read_pid() is None
+    pid_path.write_bytes(b"not-a-pid")
+    assert daemon._read_pid() is None
+    pid_path.write_bytes(b"1234\n")
+    assert daemon._read_pid() == 1234
+
+    daemon._write_pid()
+    assert daemon._read_pid() == os.getpid()
+
+
+def test_daemon_running_ignores_stale_pid(monkeypatch, tmp_path) -> None:
+    pid_path = tmp_path / "whisperflow.pid"
+    pid_path.write_bytes(b"1234")
+    monkeypatch.setattr(daemon, "PID_PATH", pid_path)
+
+    def no_such_process(_pid: int, _signal: int) -> None:
+        raise ProcessLookupError
+
+    monkeypatch.setattr(daemon.os, "kill", no_such_process)
+
+    assert daemon._daemon_running() is False
+
+
+def test_wait_for_daemon_exit_polls_without_pidfd(monkeypatch, tmp_path) -> None:
+    pid_path = tmp_path / "whisperflow.pid"
+    pid_path.write_bytes(b"1234")
+    monkeypatch.setattr(daemon, "PID_PATH", pid_path)
+    monkeypatch.delattr(daemon.os, "pidfd_open", raising=False)
+    running = iter([True, True, False])
+    monkeypatch.setattr(daemon, "_daemon_running", lambda: next(running))
+    monkeypatch.setattr(daemon.time, "sleep", lambda _seconds: None)
+
+    assert daemon._wait_for_daemon_exit(timeout=5.0) is True
+
+
+def test_wait_for_daemon_exit_waits_on_pidfd(monkeypatch, tmp_path) -> None:
+    pid_path = tmp_path / "whisperflow.pid"
+    pid_path.write_bytes(b"1234")
+    monkeypatch.setattr(daemon, "PID_PATH", pid_path)
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"x")
+    os.close(write_fd)
+    monkeypatch.setattr(daemon.os, "pidfd_open", lambda _pid: read_fd, raising=False)
+    monkeypatch.setattr(daemon, "_daemon_running", lambda: False)
+
+    assert daemon._wait_for_daemon_exit(timeout=5.0) is True
+    with pytest.raises(OSError):
+        os.fstat(read_fd)
+
+
+def test_wait_for_daemon_ready_falls_back_to_polling(monkeypatch, tmp_path) -> None:
+    socket_path = tmp_path / "whisperflow.sock"
+    monkeypatch.setattr(daemon, "SOCKET_PATH", socket_path)
+    monkeypatch.delattr(daemon.os, "pidfd_open", raising=False)
+    monkeypatch.setattr(daemon, "_pid_running", lambda _pid: True)
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        socket_path.touch()
+
+    monkeypatch.setattr(daemon.time, "sleep", fake_sleep)
+
+    assert daemon._wait_for_daemon_ready(1234, timeout=5.0) is True
+    assert sleeps == [0.1]
+
+
+def test_wait_for_daemon_ready_stops_when_daemon_dies(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(daemon, "SOCKET_PATH", tmp_path / "whisperflow.sock")
+    read_fd, write_fd = os.pipe()
+    os.close(write_fd)
+    monkeypatch.setattr(daemon.os, "pidfd_open", lambda _pid: read_fd, raising=False)
+
+    assert daemon._wait_for_daemon_ready(1234, timeout=5.0) is False
+
+
+def test_run_daemon_flushes_state_when_serve_fails(monkeypatch, tmp_path) -> None:
+    writes = _capture_writes(monkeypatch)
+    capture_running = threading.Event()
+    config = {"web": {}, "tray": {}, "live_capture": {"audio": {}}}
+    monkeypatch.setattr(daemon, "load_config", lambda _path: config)
+    monkeypatch.setattr(daemon, "setup_logging", lambda _config: None)
+    monkeypatch.setattr(daemon, "_maybe_unload_ollama_models", lambda _config: None)
+    monkeypatch.setattr(daemon, "_ensure_run_dir", lambda: None)
+    monkeypatch.setattr(daemon, "_cleanup_socket", lambda: None)
+    monkeypatch.setattr(daemon, "_build_state", lambda _config: {"status": "starting"})
+    monkeypatch.setattr(daemon, "_write_pid", lambda: None)
+    monkeypatch.setattr(daemon, "_install_signal_handlers", lambda _event: None)
+
+    def fake_capture(_config, _overrides, stop_event, _dashboard):  # noqa: ANN001
+        capture_running.set()
+        stop_event.wait()
+
+    def failing_serve(_path, stop_event, _handler) -> None:  # noqa: ANN001
+        capture_running.wait(timeout=2.0)
+        stop_event.set()
+        raise OSError("address in use")
+
+    monkeypatch.setattr(daemon, "run_live_capture", fake_capture)
+    monkeypatch.setattr(daemon, "serve", failing_serve)
+
+    with pytest.raises(OSError, match="address in use"):
+        daemon._run_daemon(tmp_path / "config.json")
+
+    assert writes[-1] == {"status": "running"}
@@ -0,0 +1,82 @@
+"""Tests for daemon IPC helpers."""
+
+from __future__ import annotations
+
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from whisperflow import ipc
+
+
+def test_frame_round_trip() -> None:
+    left, right = socket.socketpair()
+    with left, right:
+        ipc._send_frame(left, b'{"command": "status"}')
+        ipc._send_frame(left, b"")
+        assert ipc._recv_frame(right) == b'{"command": "status"}'
+        assert ipc._recv_frame(right) == b""
+
+
+def test_recv_frame_rejects_truncated_frame() -> None:
+    left, right = socket.socketpair()
+    with right:
+        with left:
+            left.sendall(ipc._FRAME_HEADER.pack(10) + b"abc")
+        with pytest.raises(ConnectionError):
+            ipc._recv_frame(right)
+
+
+def test_send_command_round_trip() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / "daemon.sock"
+        stop_event = threading.Event()
+        requests: list[dict] = []
+
+        def handler(request):  # noqa: ANN001
+            requests.append(request)
+            return {"ok": True, "echo": request["payload"]}
+
+        thread = threading.Thread(
+            target=ipc.serve, args=(socket_path, stop_event, handler), daemon=True
+        )
+        thread.start()
+        try:
+            for _ in range(100):
+                if socket_path.exists():
+                    break
+                stop_event.wait(0.01)
+            response = ipc.send_command(socket_path, "status", {"value": 1})
+        finally:
+            stop_event.set()
+            thread.join(timeout=2.0)
+
+    assert response == {"ok": True, "echo": {"value": 1}}
+    assert requests == [{"command": "status", "payload": {"value": 1}}]
+
+
+def test_serve_returns_promptly_when_stopped() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / "daemon.sock"
+        stop_event = threading.Event()
+        thread = threading.Thread(
+            target=ipc.serve,
+            args=(socket_path, stop_event, lambda request: {"ok": True}),
+            daemon=True,
+        )
+        thread.start()
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            stop_event.wait(0.01)
+
+        started = time.monotonic()
+        stop_event.set()
+        thread.join(timeout=2.0)
+
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 0.4
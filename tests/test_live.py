@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timezone
 
+from whisperflow import live
 from whisperflow.live import (
+    _RingBuffer,
     _backup_existing_dir,
     _backup_existing_file,
+    _format_ts,
+    _is_digital_silence,
     _preview_transcript,
     _read_transcript,
     _rms_energy,
@@ -34,6 +39,12 @@ def test_backup_existing_file_creates_timestamped_copy(tmp_path, monkeypatch) ->
     assert backup.read_text(encoding="utf-8") == "hello"
 
 
+def test_format_ts_matches_isoformat() -> None:
+    moment = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert _format_ts(moment) == "2024-01-02T03:04:05Z"
+    assert _format_ts(moment.replace(second=6)) == "2024-01-02T03:04:06Z"
+
+
 def test_backup_existing_dir_creates_timestamped_copy(tmp_path, monkeypatch) -> None:
     source = tmp_path / "live_segments"
     source.mkdir()
@@ -106,10 +117,47 @@ def test_rms_energy_and_trim_buffer() -> None:
     loud = b"\x10\x27" * 4
     assert _rms_energy(loud) > 0.0
 
-    buffer = [b"0" * 4, b"1" * 4]
-    trimmed, buffer_ms = _trim_buffer(buffer, 4.0, 2, 1000, 1)
-    assert len(trimmed) == 1
+    buffer = _RingBuffer(8)
+    buffer.write(b"0" * 4)
+    buffer.write(b"1" * 4)
+    buffer_ms = _trim_buffer(buffer, 2, 1000, 1)
+    assert len(buffer) == 4
     assert buffer_ms <= 2.0
+    assert buffer.drain() == b"1" * 4
+
+
+def test_rms_energy_without_numpy_matches(monkeypatch) -> None:
+    loud = b"\x10\x27" * 4
+    expected = _rms_energy(loud)
+    monkeypatch.setattr("whisperflow.live._HAS_NUMPY", False)
+    monkeypatch.setattr("whisperflow.live._sum_squares", None)
+
+    assert abs(_rms_energy(loud) - expected) < 1e-6
+    assert _rms_energy(b"\x00\x00" * 500) == 0.0
+
+
+def test_is_digital_silence_detects_zero_chunks() -> None:
+    assert _is_digital_silence(b"\x00\x00" * 500)
+    assert _is_digital_silence(memoryview(bytearray(1000)).toreadonly())
+    assert not _is_digital_silence(b"\x00\x00" * 499 + b"\x01\x00")
+
+
+def test_ring_buffer_wraps_and_drains_in_order() -> None:
+    buffer = _RingBuffer(6)
+    buffer.write(b"aaaa")
+    buffer.write(b"bbbb")
+    assert len(buffer) == 6
+    assert buffer.drain() == b"aabbbb"
+    assert len(buffer) == 0
+
+    buffer.write(b"cc")
+    buffer.write(b"0123456789")
+    assert buffer.drain() == b"456789"
+
+    buffer.write(b"aaaa")
+    buffer.discard_oldest(4)
+    buffer.write(b"bbcc")
+    assert buffer.drain() == b"bbcc"
 
 
 def test_preview_and_read_transcript(tmp_path) -> None:
@@ -118,3 +166,81 @@ def test_preview_and_read_transcript(tmp_path) -> None:
 
     missing = _read_transcript([str(tmp_path / "missing.txt")])
     assert missing == ""
+
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("one\n", encoding="utf-8")
+    second.write_text("two\n", encoding="utf-8")
+    combined = _read_transcript(
+        [str(first), str(tmp_path / "missing.txt"), str(second)]
+    )
+    assert combined == "one\ntwo\n"
+
+
+def test_capture_cpu_pin_is_dropped_while_transcribing(monkeypatch) -> None:
+    calls: list[tuple] = []
+    monkeypatch.setenv("WHISPERFLOW_CAPTURE_CPU", "1")
+    monkeypatch.setattr(live.os, "getpriority", lambda *_: 0)
+    monkeypatch.setattr(
+        live.os,
+        "setpriority",
+        lambda _which, _who, value: calls.append(("nice", value)),
+    )
+    monkeypatch.setattr(live.os, "sched_getaffinity", lambda _pid: {0, 1, 2, 3})
+    monkeypatch.setattr(
+        live.os, "sched_setaffinity", lambda _pid, cpus: calls.append(("cpus", cpus))
+    )
+
+    def run_in_capture_thread() -> None:
+        live._boost_capture_thread()
+        with live._unboosted():
+            calls.append(("transcribe",))
+
+    thread = threading.Thread(target=run_in_capture_thread)
+    thread.start()
+    thread.join()
+
+    assert calls == [
+        ("nice", -10),
+        ("cpus", {1}),
+        ("nice", 0),
+        ("cpus", {0, 1, 2, 3}),
+        ("transcribe",),
+        ("nice", -10),
+        ("cpus", {1}),
+    ]
+
+
+def test_unboosted_is_a_no_op_without_a_boost(monkeypatch) -> None:
+    calls: list[tuple] = []
+    monkeypatch.setattr(live.os, "setpriority", lambda *args: calls.append(args))
+    monkeypatch.setattr(live.os, "sched_setaffinity", lambda *args: calls.append(args))
+
+    def run() -> None:
+        with live._unboosted():
+            pass
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+
+    assert calls == []
+
+
+def test_rms_energy_ignores_trailing_odd_byte(monkeypatch) -> None:
+    odd = b"\x10\x27" * 4 + b"\x01"
+    expected = _rms_energy(b"\x10\x27" * 4)
+    results = [_rms_energy(odd), _rms_energy(memoryview(odd))]
+
+    monkeypatch.setattr(
+        "whisperflow.live._sum_squares",
+        lambda values: sum(int(value) ** 2 for value in values),
+    )
+    if live._HAS_NUMPY:
+        results.append(_rms_energy(odd))
+    monkeypatch.setattr("whisperflow.live._sum_squares", None)
+    monkeypatch.setattr("whisperflow.live._HAS_NUMPY", False)
+    results.append(_rms_energy(odd))
+
+    assert all(abs(result - expected) < 1e-6 for result in results)
+    assert _rms_energy(b"\x01") == 0.0
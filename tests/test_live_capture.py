@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import copy
 import re
 import threading
 import types
 from pathlib import Path
 
-from whisperflow.config import DEFAULT_CONFIG
+import pytest
+
+from whisperflow.config import clone_config
+from whisperflow.errors import WhisperflowRuntimeError
 from whisperflow.live import run_live_capture, run_output_capture
 from whisperflow.web_dashboard import LiveDashboard
 
@@ -27,23 +29,27 @@ def _assert_timestamped_line(content: str, expected_text: str) -> None:
 def test_run_live_capture_writes_transcript(tmp_path, monkeypatch) -> None:
     stop_event = threading.Event()
 
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["output_dir"] = str(tmp_path)
-    config["live_capture"] = dict(config["live_capture"])
-    config["live_capture"]["vad"] = {
-        "enabled": False,
-        "silence_ms": 500,
-        "min_speech_ms": 250,
-        "energy_threshold": 0.01,
-        "max_buffer_ms": 1000,
-    }
-    config["live_capture"]["audio"] = {
-        "device": "default",
-        "sample_rate": 1000,
-        "channels": 1,
-        "chunk_ms": 1000,
-        "include_output": False,
-    }
+    config = clone_config(
+        {
+            "output_dir": str(tmp_path),
+            "live_capture": {
+                "vad": {
+                    "enabled": False,
+                    "silence_ms": 500,
+                    "min_speech_ms": 250,
+                    "energy_threshold": 0.01,
+                    "max_buffer_ms": 1000,
+                },
+                "audio": {
+                    "device": "default",
+                    "sample_rate": 1000,
+                    "channels": 1,
+                    "chunk_ms": 1000,
+                    "include_output": False,
+                },
+            },
+        }
+    )
 
     class FakeCapture:
         def __init__(self) -> None:
@@ -92,23 +98,27 @@ def test_run_live_capture_writes_transcript(tmp_path, monkeypatch) -> None:
 def test_run_live_capture_with_vad(tmp_path, monkeypatch) -> None:
     stop_event = threading.Event()
 
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["output_dir"] = str(tmp_path)
-    config["live_capture"] = dict(config["live_capture"])
-    config["live_capture"]["vad"] = {
-        "enabled": True,
-        "silence_ms": 500,
-        "min_speech_ms": 250,
-        "energy_threshold": 0.01,
-        "max_buffer_ms": 5000,
-    }
-    config["live_capture"]["audio"] = {
-        "device": "default",
-        "sample_rate": 1000,
-        "channels": 1,
-        "chunk_ms": 500,
-        "include_output": False,
-    }
+    config = clone_config(
+        {
+            "output_dir": str(tmp_path),
+            "live_capture": {
+                "vad": {
+                    "enabled": True,
+                    "silence_ms": 500,
+                    "min_speech_ms": 250,
+                    "energy_threshold": 0.01,
+                    "max_buffer_ms": 5000,
+                },
+                "audio": {
+                    "device": "default",
+                    "sample_rate": 1000,
+                    "channels": 1,
+                    "chunk_ms": 500,
+                    "include_output": False,
+                },
+            },
+        }
+    )
 
     class FakeCapture:
         def __init__(self) -> None:
@@ -158,23 +168,27 @@ def test_run_live_capture_with_vad(tmp_path, monkeypatch) -> None:
 def test_run_output_capture(tmp_path, monkeypatch) -> None:
     stop_event = threading.Event()
 
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["output_dir"] = str(tmp_path)
-    config["live_capture"] = dict(config["live_capture"])
-    config["live_capture"]["vad"] = {
-        "enabled": False,
-        "silence_ms": 500,
-        "min_speech_ms": 250,
-        "energy_threshold": 0.01,
-        "max_buffer_ms": 1000,
-    }
-    config["live_capture"]["audio"] = {
-        "device": "default",
-        "sample_rate": 1000,
-        "channels": 1,
-        "chunk_ms": 1000,
-        "include_output": True,
-    }
+    config = clone_config(
+        {
+            "output_dir": str(tmp_path),
+            "live_capture": {
+                "vad": {
+                    "enabled": False,
+                    "silence_ms": 500,
+                    "min_speech_ms": 250,
+                    "energy_threshold": 0.01,
+                    "max_buffer_ms": 1000,
+                },
+                "audio": {
+                    "device": "default",
+                    "sample_rate": 1000,
+                    "channels": 1,
+                    "chunk_ms": 1000,
+                    "include_output": True,
+                },
+            },
+        }
+    )
 
     class FakeCapture:
         def __init__(self) -> None:
@@ -223,23 +237,27 @@ def test_run_output_capture(tmp_path, monkeypatch) -> None:
 def test_run_live_capture_flushes_on_max_buffer(tmp_path, monkeypatch) -> None:
     stop_event = threading.Event()
 
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["output_dir"] = str(tmp_path)
-    config["live_capture"] = dict(config["live_capture"])
-    config["live_capture"]["vad"] = {
-        "enabled": True,
-        "silence_ms": 500,
-        "min_speech_ms": 250,
-        "energy_threshold": 0.01,
-        "max_buffer_ms": 500,
-    }
-    config["live_capture"]["audio"] = {
-        "device": "default",
-        "sample_rate": 1000,
-        "channels": 1,
-        "chunk_ms": 500,
-        "include_output": False,
-    }
+    config = clone_config(
+        {
+            "output_dir": str(tmp_path),
+            "live_capture": {
+                "vad": {
+                    "enabled": True,
+                    "silence_ms": 500,
+                    "min_speech_ms": 250,
+                    "energy_threshold": 0.01,
+                    "max_buffer_ms": 500,
+                },
+                "audio": {
+                    "device": "default",
+                    "sample_rate": 1000,
+                    "channels": 1,
+                    "chunk_ms": 500,
+                    "include_output": False,
+                },
+            },
+        }
+    )
 
     class FakeCapture:
         def __init__(self) -> None:
@@ -282,3 +300,29 @@ def test_run_live_capture_flushes_on_max_buffer(tmp_path, monkeypatch) -> None:
     content = raw_path.read_text(encoding="utf-8")
     lines = [line for line in content.splitlines() if line.strip()]
     assert len(lines) >= 2
+
+
+def test_capture_start_failure_leaves_no_transcript(tmp_path, monkeypatch) -> None:
+    config = clone_config({"output_dir": str(tmp_path)})
+
+    class FailingCapture:
+        def start(self) -> None:
+            raise WhisperflowRuntimeError("no device")
+
+        def stop(self) -> None:
+            raise AssertionError("stop should not run before a successful start")
+
+    monkeypatch.setattr(
+        "whisperflow.live.open_audio_capture", lambda *_: FailingCapture()
+    )
+    monkeypatch.setattr(
+        "whisperflow.live.open_output_capture", lambda *_: FailingCapture()
+    )
+
+    for run in (run_live_capture, run_output_capture):
+        with pytest.raises(WhisperflowRuntimeError, match="no device"):
+            run(config, {}, threading.Event())
+
+    live_config = config["live_capture"]
+    assert not (tmp_path / live_config["raw_transcript_filename"]).exists()
+    assert not (tmp_path / live_config["output_raw_transcript_filename"]).exists()
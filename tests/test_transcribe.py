@@ -2,23 +2,20 @@
 
 from __future__ import annotations
 
-import copy
 import os
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
-from whisperflow.config import DEFAULT_CONFIG
+from whisperflow.config import clone_config
 from whisperflow.errors import WhisperflowRuntimeError, UserInputError
 from whisperflow.transcribe import run_transcribe
 import whisperflow.transcribe as transcribe
 
 
 def _config_for(tmp_path: Path) -> dict[str, object]:
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config["output_dir"] = str(tmp_path / "output")
-    return config
+    return clone_config({"output_dir": str(tmp_path / "output")})
 
 
 def _make_executable(path: Path) -> None:
@@ -72,10 +69,10 @@ def test_command_omits_language_for_auto(
     captured: dict[str, list[str]] = {}
 
     def fake_run(
-        command: list[str], capture_output: bool, text: bool, check: bool
+        command: list[str], stdout: int, stderr: int, check: bool
     ) -> SimpleNamespace:
         captured["command"] = command
-        return SimpleNamespace(returncode=0, stdout="", stderr="")
+        return SimpleNamespace(returncode=0, stdout=None, stderr=b"")
 
     monkeypatch.setattr(transcribe.subprocess, "run", fake_run)
 
@@ -99,10 +96,10 @@ def test_command_includes_language_override(
     captured: dict[str, list[str]] = {}
 
     def fake_run(
-        command: list[str], capture_output: bool, text: bool, check: bool
+        command: list[str], stdout: int, stderr: int, check: bool
     ) -> SimpleNamespace:
         captured["command"] = command
-        return SimpleNamespace(returncode=0, stdout="", stderr="")
+        return SimpleNamespace(returncode=0, stdout=None, stderr=b"")
 
     monkeypatch.setattr(transcribe.subprocess, "run", fake_run)
 
@@ -111,6 +108,17 @@ def test_command_includes_language_override(
     assert "--language" in captured["command"]
     language_index = captured["command"].index("--language") + 1
     assert captured["command"][language_index] == "en"
+    assert captured["command"][-1] == str(input_path)
+
+
+def test_command_prefix_is_cached(tmp_path: Path) -> None:
+    args = (tmp_path / "exec", "small", "transcribe", "txt", tmp_path / "out")
+
+    first = transcribe._command_prefix(*args)
+
+    assert transcribe._command_prefix(*args) is first
+    assert first[0] == str(tmp_path / "exec")
+    assert first[-1] == str(tmp_path / "out")
 
 
 def test_output_dir_must_be_directory(
@@ -160,6 +168,29 @@ def test_executable_must_be_executable(
         run_transcribe(str(input_path), config, {})
 
 
+def test_executable_validation_is_cached_until_mode_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    exec_path = tmp_path / "faster-whisper-gpu"
+    _make_executable(exec_path)
+    access_calls: list[Path] = []
+    real_access = os.access
+
+    def counting_access(path, mode):  # noqa: ANN001
+        access_calls.append(path)
+        return real_access(path, mode)
+
+    monkeypatch.setattr(transcribe.os, "access", counting_access)
+
+    transcribe._validate_executable(exec_path)
+    transcribe._validate_executable(exec_path)
+    assert len(access_calls) == 1
+
+    os.chmod(exec_path, 0o644)
+    with pytest.raises(WhisperflowRuntimeError, match="not executable"):
+        transcribe._validate_executable(exec_path)
+
+
 def test_transcribe_reports_subprocess_error(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -172,9 +203,9 @@ def test_transcribe_reports_subprocess_error(
     monkeypatch.setattr(transcribe, "EXECUTABLE_PATH", exec_path)
 
     def fake_run(
-        command: list[str], capture_output: bool, text: bool, check: bool
+        command: list[str], stdout: int, stderr: int, check: bool
     ) -> SimpleNamespace:
-        return SimpleNamespace(returncode=1, stdout="", stderr="")
+        return SimpleNamespace(returncode=1, stdout=None, stderr=b"")
 
     monkeypatch.setattr(transcribe.subprocess, "run", fake_run)
 
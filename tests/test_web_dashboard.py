@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import http.client
 import json
+import queue
 import threading
 import time
 import urllib.request
 
+import pytest
+
+from whisperflow import web_dashboard
 from whisperflow.web_dashboard import LiveDashboard, start_dashboard_server
 
 
@@ -38,6 +43,61 @@ def test_dashboard_server_serves_stats() -> None:
     assert b"Whisperflow Live Dashboard" in html
 
 
+def test_dashboard_server_answers_while_event_streams_are_open() -> None:
+    dashboard = LiveDashboard({})
+    stop_event = threading.Event()
+    server = start_dashboard_server(dashboard, stop_event, "127.0.0.1", 0)
+
+    host, port = server.server_address[:2]
+    streams = [http.client.HTTPConnection(host, port, timeout=2) for _ in range(3)]
+    try:
+        for stream in streams:
+            stream.request("GET", "/events")
+            response = stream.getresponse()
+            assert response.getheader("Content-Type") == "text/event-stream"
+        started = time.monotonic()
+        stats = json.loads(_fetch(f"http://{host}:{port}/stats"))
+        elapsed = time.monotonic() - started
+    finally:
+        for stream in streams:
+            stream.close()
+        stop_event.set()
+        server.server_close()
+
+    assert stats["status"] == "starting"
+    assert elapsed < 1.0
+
+
+def test_dashboard_server_keeps_connection_alive() -> None:
+    dashboard = LiveDashboard({})
+    stop_event = threading.Event()
+    server = start_dashboard_server(dashboard, stop_event, "127.0.0.1", 0)
+
+    host, port = server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=2)
+    try:
+        connection.request("GET", "/stats")
+        first = connection.getresponse()
+        first.read()
+        sock = connection.sock
+        connection.request("GET", "/")
+        second = connection.getresponse()
+        second.read()
+        connection.request("GET", "/stats")
+        third = connection.getresponse()
+        payload = json.loads(third.read())
+        reused = connection.sock is sock
+    finally:
+        connection.close()
+        stop_event.set()
+        server.server_close()
+
+    assert first.version == 11
+    assert second.status == 200
+    assert reused
+    assert payload["status"] == "starting"
+
+
 def test_dashboard_server_streams_events() -> None:
     dashboard = LiveDashboard(
         {
@@ -81,6 +141,63 @@ def test_dashboard_listener_lifecycle() -> None:
     assert payload["last_error"] == "boom"
 
 
+def test_dashboard_listener_keeps_latest_backlog(monkeypatch) -> None:
+    monkeypatch.setattr("whisperflow.web_dashboard._LISTENER_BACKLOG", 2)
+    dashboard = LiveDashboard({})
+    listener = dashboard.register_listener()
+    for status in ("one", "two", "three"):
+        dashboard.set_status(status)
+
+    assert listener.get(timeout=0)["status"] == "two"
+    assert listener.get(timeout=0)["status"] == "three"
+    with pytest.raises(queue.Empty):
+        listener.get(timeout=0.01)
+    dashboard.unregister_listener(listener)
+
+
+def test_dashboard_snapshot_json_is_reused_until_state_changes() -> None:
+    dashboard = LiveDashboard({})
+    first = dashboard.snapshot_json()
+
+    assert dashboard.snapshot_json() is first
+    dashboard.mark_error("boom")
+    updated = dashboard.snapshot_json()
+    assert updated is not first
+    assert json.loads(updated)["last_error"] == "boom"
+
+
+def test_dashboard_batch_publishes_once() -> None:
+    dashboard = LiveDashboard({})
+    listener = dashboard.register_listener()
+
+    with dashboard.batch():
+        dashboard.mark_error("boom")
+        dashboard.segment_finished(1, 1000.0, 500.0, False, "")
+        with pytest.raises(queue.Empty):
+            listener.get(timeout=0)
+
+    payload = listener.get(timeout=0)
+    assert payload["last_error"] == "boom"
+    assert payload["segments_failed"] == 1
+    with pytest.raises(queue.Empty):
+        listener.get(timeout=0)
+
+
+def test_dashboard_heartbeat_only_wakes_idle_listeners() -> None:
+    dashboard = LiveDashboard({})
+    busy = dashboard.register_listener()
+    dashboard.mark_error("queued")
+    idle = dashboard.register_listener()
+
+    dashboard.send_heartbeat()
+    dashboard.close_listeners()
+
+    assert idle.get(timeout=0) is web_dashboard._HEARTBEAT
+    assert idle.get(timeout=0) is web_dashboard._CLOSED
+    assert busy.get(timeout=0)["last_error"] == "queued"
+    assert busy.get(timeout=0) is web_dashboard._CLOSED
+
+
 def test_dashboard_output_segment_snapshot() -> None:
     dashboard = LiveDashboard(
         {
@@ -117,3 +234,19 @@ def test_dashboard_transcript_accumulates() -> None:
 
     assert snapshot["live_transcript"] == "hello world"
     assert snapshot["output_transcript"] == "from output"
+
+
+def test_listener_put_and_is_idle() -> None:
+    condition = threading.Condition()
+    listener = web_dashboard._Listener(condition, maxlen=2)
+
+    with condition:
+        assert listener.is_idle()
+        for index in range(3):
+            listener.put({"index": index})
+        assert not listener.is_idle()
+
+    assert listener.get(timeout=0) == {"index": 1}
+    assert listener.get(timeout=0) == {"index": 2}
+    with condition:
+        assert listener.is_idle()
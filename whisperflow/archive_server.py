@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import io
+import os
+import stat
 import threading
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
@@ -13,20 +20,152 @@ from whisperflow.config import load_config
 from whisperflow.errors import WhisperflowRuntimeError, format_error
 
 DEFAULT_CONFIG_PATH = Path("config") / "config.json"
+DEFAULT_THREAD_POOL = 32
+# Requests are a few header lines from a local browser, so a short timeout is
+# plenty for an active client and frees a pool worker soon after a tab goes idle.
+KEEPALIVE_TIMEOUT_S = 2.0
+CACHE_MAX_AGE_S = 60
+LISTING_CACHE_SIZE = 64
+# Filesystems with coarse timestamps (FAT: 2 s) can add an entry without moving
+# the directory mtime if it lands in the same tick, so a listing is only cached
+# once its mtime is older than that.
+LISTING_SETTLE_NS = 2_000_000_000
 
 
 class ArchiveRequestHandler(SimpleHTTPRequestHandler):
     """Serve files from the archive root with directory listings."""
 
+    # Browsers page through many small transcript files; keep their connections
+    # open, but let idle ones go quickly since each one pins a pool worker.
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT_S
+    _etag: str | None = None
+
+    def send_head(self) -> Any:
+        self._etag = None
+        try:
+            info = os.stat(self.translate_path(self.path))
+        except OSError:
+            return super().send_head()
+        if stat.S_ISREG(info.st_mode):
+            etag = f'"{info.st_mtime_ns:x}-{info.st_size:x}"'
+            if _etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return None
+            self._etag = etag
+        return super().send_head()
+
+    def end_headers(self) -> None:
+        etag = self._etag
+        if etag is not None:
+            self._etag = None
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"max-age={CACHE_MAX_AGE_S}")
+        super().end_headers()
+
+    def list_directory(self, path: str | os.PathLike[str]) -> Any:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return super().list_directory(path)
+        if time.time_ns() - mtime_ns < LISTING_SETTLE_NS:
+            return super().list_directory(path)
+        cache: _ListingCache = self.server.listing_cache  # type: ignore[attr-defined]
+        key = (os.fspath(path), self.path)
+        body = cache.get(key, mtime_ns)
+        if body is None:
+            listing = super().list_directory(path)
+            if listing is not None:
+                cache.put(key, mtime_ns, listing.getvalue())
+            return listing
+        encoding = sys.getfilesystemencoding()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", f"text/html; charset={encoding}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        return io.BytesIO(body)
+
+    def copyfile(self, source: Any, outputfile: Any) -> None:
+        # socket.sendfile uses os.sendfile for real files and falls back to plain
+        # sends for in-memory directory listings.
+        self.connection.sendfile(source)
+
     def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
         return
 
 
+class _ListingCache:
+    """LRU of rendered directory listings, invalidated by the directory mtime.
+
+    Callers only store listings whose mtime has settled (see
+    ``LISTING_SETTLE_NS``), so a later change always moves the mtime.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], tuple[int, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str], mtime_ns: int) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != mtime_ns:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: tuple[str, str], mtime_ns: int, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (mtime_ns, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+class _ArchiveServer(ThreadingHTTPServer):
+    """Handle requests on a bounded worker pool instead of a thread per request."""
+
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(self, *args: Any, max_workers: int, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.listing_cache = _ListingCache(LISTING_CACHE_SIZE)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="whisperflow-archive-worker"
+        )
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        try:
+            future = self._pool.submit(
+                self.process_request_thread, request, client_address
+            )
+        except RuntimeError:
+            # The pool is already shut down.
+            self.shutdown_request(request)
+            return
+
+        def close_if_cancelled(done: Future[None]) -> None:
+            # Requests still queued when server_close() cancels them never reach
+            # a worker, so their sockets are closed here instead.
+            if done.cancelled():
+                self.shutdown_request(request)
+
+        future.add_done_callback(close_if_cancelled)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
 def start_archive_server(
     archive_root: Path,
     stop_event: threading.Event,
     host: str,
     port: int,
+    thread_pool: int = DEFAULT_THREAD_POOL,
 ) -> ThreadingHTTPServer:
     """Start the archive browser server in a background thread."""
     archive_root.mkdir(parents=True, exist_ok=True)
@@ -34,7 +173,7 @@ def start_archive_server(
     def handler_factory(*args: Any, **kwargs: Any) -> ArchiveRequestHandler:
         return ArchiveRequestHandler(*args, directory=str(archive_root), **kwargs)
 
-    server = ThreadingHTTPServer((host, port), handler_factory)
+    server = _ArchiveServer((host, port), handler_factory, max_workers=thread_pool)
 
     thread = threading.Thread(
         target=server.serve_forever, name="whisperflow-archive", daemon=True
@@ -53,6 +192,16 @@ def start_archive_server(
     return server
 
 
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
 def _archive_root(config: dict[str, Any]) -> Path:
     archive_config = config.get("archive", {})
     dir_name = "archives"
@@ -89,10 +238,13 @@ def main(argv: list[str] | None = None) -> int:
 
         host = archive_web.get("host", "127.0.0.1")
         port = int(archive_web.get("port", 8788))
+        thread_pool = int(archive_web.get("thread_pool", DEFAULT_THREAD_POOL))
         archive_root = _archive_root(config)
 
         stop_event = threading.Event()
-        server = start_archive_server(archive_root, stop_event, host, port)
+        server = start_archive_server(
+            archive_root, stop_event, host, port, thread_pool=thread_pool
+        )
         print(f"Archive browser running at http://{host}:{port} (root: {archive_root})")
         try:
             stop_event.wait()
@@ -2,27 +2,85 @@
 
 from __future__ import annotations
 
-import json
+import fcntl
+import functools
 import logging
 import os
-import queue
 import re
 import select
 import shutil
 import subprocess
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Optional, Protocol
+from typing import Any, Callable, Optional, Protocol
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from whisperflow.errors import WhisperflowRuntimeError
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass(frozen=True)
+DEVICE_CACHE_TTL_S = 5.0
+
+# pactl output is parsed as bytes; only the captured values are decoded.
+_PACTL_DEFAULT_RE = re.compile(
+    rb"^Default (Source|Sink):[ \t]*(.*?)[ \t]*$", re.MULTILINE
+)
+_PACTL_SOURCE_SPLIT_RE = re.compile(rb"^[ \t]*Source #", re.MULTILINE)
+_PACTL_NAME_RE = re.compile(rb"^[ \t]*Name:[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+_PACTL_METADATA_RE = re.compile(
+    rb"^[ \t]*(?:Description:[ \t]*(?P<description>.*?)"
+    rb"|(?P<key>device\.description|device\.product\.name|alsa\.card_name"
+    rb"|alsa\.long_card_name)[ \t]*=[ \t]*(?P<value>.*?))[ \t]*$",
+    re.MULTILINE,
+)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_PACTL_PROPERTY_KEYS = {
+    b"device.description": "device_description",
+    b"device.product.name": "product_name",
+    b"alsa.card_name": "card_name",
+    b"alsa.long_card_name": "long_card_name",
+}
+
+_ARECORD_PREFIX = ("arecord", "-q", "-f", "S16_LE", "-r")
+_ARECORD_SUFFIX = ("-t", "raw")
+_PW_RECORD_PREFIX = ("pw-record", "--rate")
+_PW_RECORD_SUFFIX = ("--format", "s16", "--raw")
+
+_SD_MAX_QUEUED_CHUNKS = 100
+_PIPE_CHUNKS = 8
+_READ_BATCH_CHUNKS = 4
+_POOL_MAX_FREE = 64
+_STDERR_TAIL_LINES = 32
+
+_SD_AVAILABLE: bool | None = None
+_SD_MODULE: Any = None
+# (PATH, backend) chosen for "auto"; the PATH guards against stale lookups.
+_AUTO_BACKEND: tuple[str, str] | None = None
+_AUTO_BACKEND_LOCK = threading.Lock()
+_DEVICES_CACHE: tuple[Any, float, list[Any]] | None = None
+_DEVICE_INFO_CACHE: dict[str | int | None, tuple[Any, float, Any]] = {}
+_QUERY_CACHE: dict[tuple[str, ...], tuple[float, bytes]] = {}
+_PARSED_CACHE: dict[tuple[str, ...], tuple[bytes, Any]] = {}
+_CAPTURE_POOLS: dict[tuple[int, int, int], _ChunkPool] = {}
+_CAPTURE_POOLS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
 class AudioChunk:
-    """A single chunk of PCM audio data."""
+    """A single chunk of PCM audio data.
+
+    ``data`` may be a read-only ``memoryview`` so capture backends can hand over
+    their fill buffer without copying it. Pass it to the capture's ``release()``
+    once it is no longer needed so the buffer can be reused.
+    """
 
-    data: bytes
+    data: bytes | memoryview
     sample_rate: int
     channels: int
 
@@ -39,6 +97,9 @@ class AudioCapture(Protocol):
     def stop(self) -> None:
         """Stop capturing audio."""
 
+    def release(self, data: bytes | memoryview) -> None:
+        """Hand a chunk's buffer back once the consumer no longer needs it."""
+
 
 def open_audio_capture(
     backend: str,
@@ -50,15 +111,9 @@ def open_audio_capture(
     """Create an audio capture backend based on configuration."""
     resolved = _resolve_backend(backend)
     if resolved == "pw-record":
-        target = None
-        if device == "default":
-            target = _resolve_pw_target_source()
-        else:
-            target = str(device)
-        if target:
-            logger.info("pw-record input target: %s", target)
-        command = _build_pw_record_command(sample_rate, channels, target=target)
-        return _SubprocessCapture(command, sample_rate, channels, chunk_ms)
+        return _pw_record_capture(
+            device, _resolve_pw_target_source, "input", sample_rate, channels, chunk_ms
+        )
     if resolved == "sounddevice":
         resolved_device = device
         default_source = None
@@ -72,7 +127,7 @@ def open_audio_capture(
             else:
                 default_source = _pactl_default_source()
                 if _should_use_pipewire(default_source):
-                    if shutil.which("pw-record") is not None:
+                    if _which("pw-record") is not None:
                         logger.info(
                             "Falling back to pw-record for bluetooth source '%s'.",
                             default_source,
@@ -91,9 +146,6 @@ def open_audio_capture(
     if resolved == "arecord":
         command = _build_arecord_command(device, sample_rate, channels)
         return _SubprocessCapture(command, sample_rate, channels, chunk_ms)
-    if resolved == "pw-record":
-        command = _build_pw_record_command(sample_rate, channels)
-        return _SubprocessCapture(command, sample_rate, channels, chunk_ms)
     raise WhisperflowRuntimeError(f"Unsupported audio backend: {resolved}")
 
 
@@ -107,15 +159,17 @@ def open_output_capture(
     """Create an audio capture backend for system output monitoring."""
     resolved = _resolve_backend(backend)
     if resolved == "pw-record":
-        target = None
-        if device == "default":
-            target = _resolve_pw_target_sink()
-        else:
-            target = str(device)
-        if target:
-            logger.info("pw-record output target: %s", target)
-        command = _build_pw_record_command(sample_rate, channels, target=target)
-        return _SubprocessCapture(command, sample_rate, channels, chunk_ms)
+        return _pw_record_capture(
+            device,
+            _resolve_pw_target_sink,
+            "output",
+            sample_rate,
+            channels,
+            chunk_ms,
+            missing_default=(
+                "Unable to resolve PipeWire default sink for output capture."
+            ),
+        )
     if resolved == "sounddevice":
         resolved_device = device
         if device == "default":
@@ -128,7 +182,7 @@ def open_output_capture(
                 )
 
             sink_target = _pactl_default_sink()
-            if sink_target and shutil.which("pw-record") is not None:
+            if sink_target and _which("pw-record") is not None:
                 logger.info(
                     "Using pw-record for output sink '%s'.",
                     sink_target,
@@ -151,50 +205,167 @@ def open_output_capture(
         raise WhisperflowRuntimeError(
             "arecord backend does not support output capture."
         )
-    if resolved == "pw-record":
-        target = None
-        if device == "default":
-            target = _pactl_default_sink()
-            if not target:
-                raise WhisperflowRuntimeError(
-                    "Unable to resolve PipeWire default sink for output capture."
-                )
-        elif isinstance(device, str):
-            target = device
-        command = _build_pw_record_command(sample_rate, channels, target=target)
-        return _SubprocessCapture(command, sample_rate, channels, chunk_ms)
     raise WhisperflowRuntimeError(f"Unsupported audio backend: {resolved}")
 
 
+def _pw_record_capture(
+    device: str | int,
+    resolve_default_target: Callable[[], str | None],
+    label: str,
+    sample_rate: int,
+    channels: int,
+    chunk_ms: int,
+    *,
+    missing_default: str | None = None,
+) -> _SubprocessCapture:
+    target = resolve_default_target() if device == "default" else str(device)
+    if not target and missing_default is not None:
+        raise WhisperflowRuntimeError(missing_default)
+    if target:
+        logger.info("pw-record %s target: %s", label, target)
+    command = _build_pw_record_command(sample_rate, channels, target=target)
+    return _SubprocessCapture(command, sample_rate, channels, chunk_ms)
+
+
 def _resolve_backend(backend: str) -> str:
     if backend != "auto":
         if backend == "sounddevice" and not _sounddevice_available():
             raise WhisperflowRuntimeError(
                 "sounddevice backend requested but the package is not available."
             )
-        if backend in {"arecord", "pw-record"} and shutil.which(backend) is None:
+        if backend in {"arecord", "pw-record"} and _which(backend) is None:
             raise WhisperflowRuntimeError(
                 f"{backend} backend requested but the executable is not available."
             )
         return backend
 
-    if shutil.which("pw-record") is not None:
+    global _AUTO_BACKEND
+    search_path = os.environ.get("PATH", "")
+    cached = _AUTO_BACKEND
+    if cached is not None and cached[0] == search_path:
+        return cached[1]
+    with _AUTO_BACKEND_LOCK:
+        cached = _AUTO_BACKEND
+        if cached is not None and cached[0] == search_path:
+            return cached[1]
+        resolved = _detect_backend()
+        _AUTO_BACKEND = (search_path, resolved)
+    return resolved
+
+
+def _detect_backend() -> str:
+    if _which("pw-record") is not None:
         return "pw-record"
     if _sounddevice_available():
         return "sounddevice"
-    if shutil.which("arecord") is not None:
+    if _which("arecord") is not None:
         return "arecord"
     raise WhisperflowRuntimeError(
         "No supported audio capture backend is available (sounddevice, arecord, pw-record)."
     )
 
 
+def _which(name: str) -> str | None:
+    return _which_cached(name, os.environ.get("PATH", ""))
+
+
+@functools.lru_cache(maxsize=8)
+def _which_cached(name: str, _search_path: str) -> str | None:
+    return shutil.which(name)
+
+
+def _reset_backend_cache() -> None:
+    """Forget cached executable lookups and the ``auto`` backend choice."""
+    global _AUTO_BACKEND
+    _AUTO_BACKEND = None
+    _which_cached.cache_clear()
+
+
+def _sounddevice() -> Any:
+    """Return the ``sounddevice`` module, or ``None`` when it is not installed.
+
+    The import is attempted once; later calls return the cached outcome until
+    ``_invalidate_audio_cache`` runs.
+    """
+    global _SD_AVAILABLE, _SD_MODULE
+    if _SD_AVAILABLE is None:
+        try:
+            import sounddevice
+        except ImportError:
+            _SD_AVAILABLE = False
+        else:
+            _SD_MODULE = sounddevice
+            _SD_AVAILABLE = True
+    return _SD_MODULE
+
+
 def _sounddevice_available() -> bool:
+    return _sounddevice() is not None
+
+
+def _invalidate_audio_cache() -> None:
+    """Forget cached sounddevice availability and device queries."""
+    global _SD_AVAILABLE, _SD_MODULE, _DEVICES_CACHE, _AUTO_BACKEND
+    _SD_AVAILABLE = None
+    _SD_MODULE = None
+    _AUTO_BACKEND = None
+    _DEVICES_CACHE = None
+    _DEVICE_INFO_CACHE.clear()
+
+
+def _query_sounddevice_devices(sounddevice_module) -> list[Any]:
+    global _DEVICES_CACHE
+    now = time.monotonic()
+    cached = _DEVICES_CACHE
+    if (
+        cached is not None
+        and cached[0] is sounddevice_module
+        and now - cached[1] < DEVICE_CACHE_TTL_S
+    ):
+        return cached[2]
+    devices = list(sounddevice_module.query_devices())
+    _DEVICES_CACHE = (sounddevice_module, now, devices)
+    return devices
+
+
+def _run_cached(args: list[str]) -> bytes | None:
+    """Return raw pactl/pw-dump stdout, memoized for ``DEVICE_CACHE_TTL_S``."""
+    key = tuple(args)
+    now = time.monotonic()
+    cached = _QUERY_CACHE.get(key)
+    if cached is not None and now - cached[0] < DEVICE_CACHE_TTL_S:
+        return cached[1]
     try:
-        import sounddevice  # noqa: F401
-    except ImportError:
-        return False
-    return True
+        result = subprocess.run(args, capture_output=True, check=False)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    _QUERY_CACHE[key] = (now, result.stdout)
+    return result.stdout
+
+
+def _parsed_query(args: list[str], parse: Callable[[bytes], Any]) -> Any:
+    """Return ``parse(stdout)`` for a cached query, reparsing only on new output.
+
+    The parsed value is shared between callers and must be treated as read-only.
+    """
+    output = _run_cached(args)
+    if output is None:
+        return None
+    key = tuple(args)
+    cached = _PARSED_CACHE.get(key)
+    if cached is not None and cached[0] is output:
+        return cached[1]
+    parsed = parse(output)
+    _PARSED_CACHE[key] = (output, parsed)
+    return parsed
+
+
+def _query_cache_clear() -> None:
+    """Forget memoized pactl/pw-dump output."""
+    _QUERY_CACHE.clear()
+    _PARSED_CACHE.clear()
 
 
 def _should_use_pipewire(default_source: str | None) -> bool:
@@ -223,9 +394,8 @@ def _resolve_system_device_from_source(
     source_name: str, *, label: str
 ) -> str | int | None:
     metadata = _pactl_source_metadata(source_name)
-    try:
-        import sounddevice as sd
-    except ImportError:
+    sd = _sounddevice()
+    if sd is None:
         return None
 
     description = metadata.get("description")
@@ -234,7 +404,26 @@ def _resolve_system_device_from_source(
     card_name = metadata.get("card_name")
     long_card_name = metadata.get("long_card_name")
 
-    devices = list(sd.query_devices())
+    candidates = (
+        source_name,
+        description,
+        device_description,
+        product_name,
+        card_name,
+        long_card_name,
+    )
+    normalized_candidates = [
+        normalized
+        for normalized in (_normalize_token(c) for c in candidates if c)
+        if normalized
+    ]
+    candidate_tokens = [token for c in candidates if c for token in _tokenize(c)]
+    normalized_device_description = (
+        _normalize_token(device_description) if device_description else ""
+    )
+    normalized_description = _normalize_token(description) if description else ""
+
+    devices = _query_sounddevice_devices(sd)
     best_index: int | None = None
     best_name = ""
     best_score = 0
@@ -252,20 +441,11 @@ def _resolve_system_device_from_source(
         name = str(device.get("name", ""))
         normalized_name = _normalize_token(name)
         score = _score_device_match(
-            source_name,
-            description,
-            device_description,
-            product_name,
-            card_name,
-            long_card_name,
-            device_name=name,
+            normalized_candidates, candidate_tokens, normalized_name
         )
-        if (
-            device_description
-            and _normalize_token(device_description) == normalized_name
-        ):
+        if normalized_name and normalized_device_description == normalized_name:
             score += 10
-        if description and _normalize_token(description) == normalized_name:
+        if normalized_name and normalized_description == normalized_name:
             score += 6
         if is_bluez and "bluetooth" in normalized_name:
             score += 4
@@ -343,29 +523,21 @@ def _pactl_default_sink() -> str | None:
     return info.get("default_sink")
 
 
-def _pw_dump_nodes() -> list[dict[str, Any]]:
-    try:
-        result = subprocess.run(
-            ["pw-dump"], capture_output=True, text=True, check=False
-        )
-    except OSError:
-        return []
-    if result.returncode != 0:
-        return []
-    try:
-        data = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return []
-    if not isinstance(data, list):
-        return []
-    return [item for item in data if isinstance(item, dict)]
+def _pw_node_serials() -> dict[tuple[str, str], int]:
+    """Return ``object.serial`` per ``(media.class, node.name)`` from ``pw-dump``."""
+    return _parsed_query(["pw-dump"], _parse_pw_dump) or {}
 
 
-def _pw_find_node_serial(
-    nodes: list[dict[str, Any]], name: str, media_class: str
-) -> int | None:
-    for item in nodes:
-        if item.get("type") != "PipeWire:Interface:Node":
+def _parse_pw_dump(output: bytes) -> dict[tuple[str, str], int]:
+    try:
+        data = _json_loads(output)
+    except ValueError:
+        return {}
+    if not isinstance(data, list):
+        return {}
+    serials: dict[tuple[str, str], int] = {}
+    for item in data:
+        if not isinstance(item, dict) or item.get("type") != "PipeWire:Interface:Node":
             continue
         info = item.get("info")
         if not isinstance(info, dict):
@@ -373,21 +545,23 @@ def _pw_find_node_serial(
         props = info.get("props")
         if not isinstance(props, dict):
             continue
-        if props.get("media.class") != media_class:
-            continue
-        if props.get("node.name") == name:
-            serial = props.get("object.serial")
-            if isinstance(serial, int):
-                return serial
-    return None
+        media_class = props.get("media.class")
+        name = props.get("node.name")
+        serial = props.get("object.serial")
+        if (
+            isinstance(media_class, str)
+            and isinstance(name, str)
+            and isinstance(serial, int)
+        ):
+            serials.setdefault((media_class, name), serial)
+    return serials
 
 
 def _resolve_pw_target_source() -> str | None:
     default_source = _pactl_default_source()
     if not default_source:
         return None
-    nodes = _pw_dump_nodes()
-    node_serial = _pw_find_node_serial(nodes, default_source, "Audio/Source")
+    node_serial = _pw_node_serials().get(("Audio/Source", default_source))
     if node_serial is not None:
         return str(node_serial)
     return default_source
@@ -397,8 +571,7 @@ def _resolve_pw_target_sink() -> str | None:
     default_sink = _pactl_default_sink()
     if not default_sink:
         return None
-    nodes = _pw_dump_nodes()
-    node_serial = _pw_find_node_serial(nodes, default_sink, "Audio/Sink")
+    node_serial = _pw_node_serials().get(("Audio/Sink", default_sink))
     if node_serial is not None:
         return str(node_serial)
     return default_sink
@@ -415,101 +588,76 @@ def _pactl_default_monitor_source() -> str | None:
 
 
 def _pactl_info() -> dict[str, str]:
-    try:
-        result = subprocess.run(
-            ["pactl", "info"], capture_output=True, text=True, check=False
-        )
-    except OSError:
-        return {}
-    if result.returncode != 0:
-        return {}
+    return _parsed_query(["pactl", "info"], _parse_pactl_info) or {}
+
+
+def _parse_pactl_info(output: bytes) -> dict[str, str]:
     info: dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        if line.startswith("Default Source:"):
-            info["default_source"] = line.split(":", 1)[1].strip()
-        if line.startswith("Default Sink:"):
-            info["default_sink"] = line.split(":", 1)[1].strip()
+    for match in _PACTL_DEFAULT_RE.finditer(output):
+        key = "default_source" if match.group(1) == b"Source" else "default_sink"
+        info.setdefault(key, _decode(match.group(2)))
+        if len(info) == 2:
+            break
     return info
 
 
+def _pactl_sources() -> dict[str, dict[str, str]]:
+    """Return metadata for every pactl source, keyed by source name."""
+    return _parsed_query(["pactl", "list", "sources"], _parse_sources) or {}
+
+
 def _pactl_has_source(source_name: str) -> bool:
-    try:
-        result = subprocess.run(
-            ["pactl", "list", "sources", "short"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except OSError:
-        return False
-    if result.returncode != 0:
-        return False
-    for line in result.stdout.splitlines():
-        parts = line.split("\t")
-        if len(parts) > 1 and parts[1] == source_name:
-            return True
-    return False
+    return source_name in _pactl_sources()
 
 
 def _pactl_source_metadata(source_name: str) -> dict[str, str]:
-    try:
-        result = subprocess.run(
-            ["pactl", "list", "sources"], capture_output=True, text=True, check=False
-        )
-    except OSError:
-        return {}
-    if result.returncode != 0:
-        return {}
+    return _pactl_sources().get(source_name, {})
+
 
-    metadata: dict[str, str] = {}
-    in_block = False
-    for line in result.stdout.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("Source #"):
-            in_block = False
-        if stripped.startswith("Name:"):
-            in_block = stripped.split(":", 1)[1].strip() == source_name
-        if not in_block:
+def _parse_sources(output: bytes) -> dict[str, dict[str, str]]:
+    sources: dict[str, dict[str, str]] = {}
+    for block in _PACTL_SOURCE_SPLIT_RE.split(output):
+        name_match = _PACTL_NAME_RE.search(block)
+        if name_match is None:
             continue
-        if stripped.startswith("Description:"):
-            metadata["description"] = stripped.split(":", 1)[1].strip()
-        if stripped.startswith("device.description ="):
-            metadata["device_description"] = (
-                stripped.split("=", 1)[1].strip().strip('"')
-            )
-        if stripped.startswith("device.product.name ="):
-            metadata["product_name"] = stripped.split("=", 1)[1].strip().strip('"')
-        if stripped.startswith("alsa.card_name ="):
-            metadata["card_name"] = stripped.split("=", 1)[1].strip().strip('"')
-        if stripped.startswith("alsa.long_card_name ="):
-            metadata["long_card_name"] = stripped.split("=", 1)[1].strip().strip('"')
-    return metadata
+        metadata: dict[str, str] = {}
+        for match in _PACTL_METADATA_RE.finditer(block, name_match.end()):
+            if match.group("description") is not None:
+                metadata["description"] = _decode(match.group("description"))
+            else:
+                key = _PACTL_PROPERTY_KEYS[match.group("key")]
+                metadata[key] = _decode(match.group("value").strip(b'"'))
+        sources.setdefault(_decode(name_match.group(1)), metadata)
+    return sources
 
 
-def _score_device_match(*candidates: str | None, device_name: str) -> int:
-    normalized_name = _normalize_token(device_name)
+def _decode(value: bytes) -> str:
+    return value.decode("utf-8", errors="replace")
+
+
+def _score_device_match(
+    normalized_candidates: list[str],
+    candidate_tokens: list[str],
+    normalized_name: str,
+) -> int:
+    """Score a device name against candidates normalized once by the caller."""
     score = 0
-    for candidate in candidates:
-        if not candidate:
-            continue
-        normalized_candidate = _normalize_token(candidate)
-        if not normalized_candidate:
-            continue
-        if normalized_candidate in normalized_name:
+    for candidate in normalized_candidates:
+        if candidate in normalized_name:
             score += 5
-        for token in _tokenize(candidate):
-            if token in normalized_name:
-                score += 1
+    for token in candidate_tokens:
+        if token in normalized_name:
+            score += 1
     return score
 
 
+@functools.lru_cache(maxsize=256)
 def _normalize_token(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", value.lower())
+    return _NON_ALNUM_RE.sub("", value.lower())
 
 
 def _tokenize(value: str) -> list[str]:
-    tokens = re.split(r"[^a-z0-9]+", value.lower())
-    return [token for token in tokens if len(token) > 2]
+    return [token for token in _NON_ALNUM_RE.split(value.lower()) if len(token) > 2]
 
 
 def _collect_tokens(*values: str | None) -> list[str]:
@@ -521,13 +669,36 @@ def _collect_tokens(*values: str | None) -> list[str]:
     return list(dict.fromkeys(tokens))
 
 
+def _input_settings_supported(
+    sounddevice_module, device: Optional[str | int], sample_rate: int, channels: int
+) -> bool:
+    check = getattr(sounddevice_module, "check_input_settings", None)
+    if check is None:
+        return True
+    try:
+        check(device=device, samplerate=sample_rate, channels=channels, dtype="int16")
+    except (sounddevice_module.PortAudioError, ValueError):
+        return False
+    return True
+
+
 def _default_sounddevice_samplerate(
     sounddevice_module, device: Optional[str | int]
 ) -> int | None:
-    try:
-        info = sounddevice_module.query_devices(device, "input")
-    except sounddevice_module.PortAudioError:
-        return None
+    now = time.monotonic()
+    cached = _DEVICE_INFO_CACHE.get(device)
+    if (
+        cached is not None
+        and cached[0] is sounddevice_module
+        and now - cached[1] < DEVICE_CACHE_TTL_S
+    ):
+        info = cached[2]
+    else:
+        try:
+            info = sounddevice_module.query_devices(device, "input")
+        except sounddevice_module.PortAudioError:
+            return None
+        _DEVICE_INFO_CACHE[device] = (sounddevice_module, now, info)
     if not info:
         return None
     default_rate = info.get("default_samplerate")
@@ -539,44 +710,57 @@ def _default_sounddevice_samplerate(
 def _build_arecord_command(
     device: str | int, sample_rate: int, channels: int
 ) -> list[str]:
-    command = [
-        "arecord",
-        "-q",
-        "-f",
-        "S16_LE",
-        "-r",
+    return list(_arecord_command(device, sample_rate, channels))
+
+
+@functools.lru_cache(maxsize=32)
+def _arecord_command(
+    device: str | int, sample_rate: int, channels: int
+) -> tuple[str, ...]:
+    command = (
+        *_ARECORD_PREFIX,
         str(sample_rate),
         "-c",
         str(channels),
-        "-t",
-        "raw",
-    ]
+        *_ARECORD_SUFFIX,
+    )
     if device != "default":
         device_value = f"plughw:{device}" if isinstance(device, int) else str(device)
-        command.extend(["-D", device_value])
+        command += ("-D", device_value)
     return command
 
 
 def _build_pw_record_command(
     sample_rate: int, channels: int, target: str | None = None
 ) -> list[str]:
-    command = [
-        "pw-record",
-        "--rate",
+    return list(_pw_record_command(sample_rate, channels, target))
+
+
+@functools.lru_cache(maxsize=32)
+def _pw_record_command(
+    sample_rate: int, channels: int, target: str | None
+) -> tuple[str, ...]:
+    command = (
+        *_PW_RECORD_PREFIX,
         str(sample_rate),
         "--channels",
         str(channels),
-        "--format",
-        "s16",
-        "--raw",
-    ]
+        *_PW_RECORD_SUFFIX,
+    )
     if target:
-        command.extend(["--target", target])
-    command.append("-")
-    return command
+        command += ("--target", target)
+    return (*command, "-")
 
 
 class _SoundDeviceCapture:
+    """Capture through a sounddevice callback feeding a single-producer ring.
+
+    The PortAudio thread only writes ``_slots[_head % n]`` and bumps ``_head``;
+    the reader only advances ``_tail``. When the reader falls behind by more
+    than the ring size the oldest chunks are skipped, so the callback never
+    takes a lock to drop data.
+    """
+
     def __init__(
         self, device: str | int, sample_rate: int, channels: int, chunk_ms: int
     ) -> None:
@@ -585,68 +769,100 @@ class _SoundDeviceCapture:
         self._channels = channels
         self._chunk_ms = chunk_ms
         self._stream = None
-        self._queue: queue.Queue[bytes] = queue.Queue(maxsize=100)
+        self._slots: list[bytearray] = []
+        self._head = 0
+        self._tail = 0
+        self._ready = threading.Event()
 
     def start(self) -> None:
-        import sounddevice as sd
+        sd = _sounddevice()
+        if sd is None:
+            raise WhisperflowRuntimeError(
+                "sounddevice backend requested but the package is not available."
+            )
 
         device_value: Optional[str | int] = (
             None if self._device == "default" else self._device
         )
-        frames_per_chunk = max(1, int(self._sample_rate * self._chunk_ms / 1000))
-
-        def callback(indata, _frames, _time, _status) -> None:
-            data = indata.tobytes()
-            try:
-                self._queue.put_nowait(data)
-            except queue.Full:
-                try:
-                    self._queue.get_nowait()
-                except queue.Empty:
-                    return
-                try:
-                    self._queue.put_nowait(data)
-                except queue.Full:
-                    return
+        # Probing the format is far cheaper than opening a stream, so a rate the
+        # device rejects is swapped for its default before the only open.
+        if not _input_settings_supported(
+            sd, device_value, self._sample_rate, self._channels
+        ):
+            self._fall_back_sample_rate(sd, device_value)
 
         try:
-            self._stream = sd.InputStream(
-                samplerate=self._sample_rate,
-                channels=self._channels,
-                dtype="int16",
-                blocksize=frames_per_chunk,
-                device=device_value,
-                callback=callback,
-            )
-            self._stream.start()
+            self._stream = self._open_stream(sd, device_value)
         except sd.PortAudioError as exc:
-            fallback_rate = _default_sounddevice_samplerate(sd, device_value)
-            if fallback_rate is None or fallback_rate == self._sample_rate:
+            if not self._fall_back_sample_rate(sd, device_value):
                 raise WhisperflowRuntimeError(
                     f"Failed to open audio input: {exc}"
                 ) from exc
-            logger.warning(
-                "Sounddevice sample rate %s unsupported; falling back to %s.",
-                self._sample_rate,
-                fallback_rate,
-            )
-            self._sample_rate = fallback_rate
-            frames_per_chunk = max(1, int(self._sample_rate * self._chunk_ms / 1000))
-            self._stream = sd.InputStream(
-                samplerate=self._sample_rate,
-                channels=self._channels,
-                dtype="int16",
-                blocksize=frames_per_chunk,
-                device=device_value,
-                callback=callback,
-            )
-            self._stream.start()
+            self._stream = self._open_stream(sd, device_value)
+
+    def _fall_back_sample_rate(self, sd, device_value: Optional[str | int]) -> bool:
+        fallback_rate = _default_sounddevice_samplerate(sd, device_value)
+        if fallback_rate is None or fallback_rate == self._sample_rate:
+            return False
+        logger.warning(
+            "Sounddevice sample rate %s unsupported; falling back to %s.",
+            self._sample_rate,
+            fallback_rate,
+        )
+        self._sample_rate = fallback_rate
+        return True
+
+    def _open_stream(self, sd, device_value: Optional[str | int]):
+        frames_per_chunk = max(1, int(self._sample_rate * self._chunk_ms / 1000))
+        self._allocate_slots(frames_per_chunk)
+        stream = sd.InputStream(
+            samplerate=self._sample_rate,
+            channels=self._channels,
+            dtype="int16",
+            blocksize=frames_per_chunk,
+            device=device_value,
+            callback=self._callback,
+        )
+        stream.start()
+        return stream
+
+    def _allocate_slots(self, frames_per_chunk: int) -> None:
+        slot_bytes = frames_per_chunk * self._channels * 2
+        self._slots = [bytearray(slot_bytes) for _ in range(_SD_MAX_QUEUED_CHUNKS)]
+        self._head = 0
+        self._tail = 0
+
+    def _callback(self, indata, _frames, _time, _status) -> None:
+        self._push(memoryview(indata).cast("B"))
+
+    def _push(self, data: memoryview) -> None:
+        head = self._head
+        index = head % len(self._slots)
+        slot = self._slots[index]
+        if len(slot) == len(data):
+            slot[:] = data
+        else:
+            self._slots[index] = bytearray(data)
+        self._head = head + 1
+        if not self._ready.is_set():
+            self._ready.set()
 
     def read(self, timeout: float | None = None) -> AudioChunk | None:
-        try:
-            data = self._queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        tail = self._tail
+        if self._head == tail:
+            ready = self._ready
+            ready.clear()
+            if self._head == tail:
+                ready.wait(timeout)
+                if self._head == tail:
+                    return None
+        head = self._head
+        slots = self._slots
+        capacity = len(slots)
+        if head - tail > capacity:
+            tail = head - capacity
+        data = bytes(slots[tail % capacity])
+        self._tail = tail + 1
         return AudioChunk(
             data=data, sample_rate=self._sample_rate, channels=self._channels
         )
@@ -658,6 +874,59 @@ class _SoundDeviceCapture:
         self._stream.close()
         self._stream = None
 
+    def release(self, data: bytes | memoryview) -> None:
+        return None
+
+
+class _ChunkPool:
+    """Free list of equally sized chunk buffers shared by captures of one shape."""
+
+    def __init__(self, chunk_bytes: int) -> None:
+        self.chunk_bytes = chunk_bytes
+        self._free: deque[bytearray] = deque(maxlen=_POOL_MAX_FREE)
+
+    def acquire(self) -> bytearray:
+        try:
+            return self._free.pop()
+        except IndexError:
+            return bytearray(self.chunk_bytes)
+
+    def release(self, buffer: bytearray) -> None:
+        if len(buffer) == self.chunk_bytes:
+            self._free.append(buffer)
+
+
+def _chunk_pool(sample_rate: int, channels: int, chunk_ms: int) -> _ChunkPool:
+    key = (sample_rate, channels, chunk_ms)
+    with _CAPTURE_POOLS_LOCK:
+        pool = _CAPTURE_POOLS.get(key)
+        if pool is None:
+            frames_per_chunk = max(1, int(sample_rate * chunk_ms / 1000))
+            pool = _ChunkPool(frames_per_chunk * channels * 2)
+            _CAPTURE_POOLS[key] = pool
+        return pool
+
+
+def _set_pipe_size(fd: int, size: int) -> None:
+    """Grow a pipe buffer so the recorder never stalls between reads (Linux only)."""
+    set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", None)
+    get_pipe_size = getattr(fcntl, "F_GETPIPE_SZ", None)
+    if set_pipe_size is None or get_pipe_size is None:
+        return
+    try:
+        if fcntl.fcntl(fd, get_pipe_size) < size:
+            fcntl.fcntl(fd, set_pipe_size, size)
+    except OSError as exc:
+        logger.debug("Could not resize capture pipe to %s bytes: %s", size, exc)
+
+
+def _drain_lines(stream, tail: deque[bytes]) -> None:
+    try:
+        for line in stream:
+            tail.append(line)
+    except (OSError, ValueError):
+        pass
+
 
 class _SubprocessCapture:
     def __init__(
@@ -670,18 +939,34 @@ class _SubprocessCapture:
         self._command = command
         self._sample_rate = sample_rate
         self._channels = channels
-        frames_per_chunk = max(1, int(sample_rate * chunk_ms / 1000))
-        self._chunk_bytes = frames_per_chunk * channels * 2
+        self._pool = _chunk_pool(sample_rate, channels, chunk_ms)
+        self._chunk_bytes = self._pool.chunk_bytes
         self._process: subprocess.Popen[bytes] | None = None
         self._stdout_fd: int | None = None
-        self._buffer = bytearray()
+        self._poll: select.poll | None = None
+        # Partial reads land directly in this buffer. Once full it is handed to the
+        # consumer as a read-only view and the next one is taken from the pool;
+        # consumers give it back through release() after the segment flushes.
+        self._chunk_view = memoryview(self._pool.acquire())
+        self._filled = 0
+        # Whole spare chunks offered to each readv so one syscall can drain several
+        # chunks of backlog; completed chunks wait in _ready for later read() calls.
+        self._spare: deque[memoryview] = deque()
+        self._ready: deque[memoryview] = deque()
+        # stderr is drained continuously so a chatty recorder cannot fill the pipe
+        # and stall; only the last lines are kept for the exit message.
+        self._stderr_tail: deque[bytes] = deque(maxlen=_STDERR_TAIL_LINES)
+        self._stderr_thread: threading.Thread | None = None
 
     def start(self) -> None:
         try:
+            # stdout is drained with os.readv on its fd, so a buffered reader
+            # around it would only allocate a buffer that is never used.
             self._process = subprocess.Popen(
                 self._command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                bufsize=0,
             )
         except FileNotFoundError as exc:
             raise WhisperflowRuntimeError(
@@ -689,44 +974,96 @@ class _SubprocessCapture:
             ) from exc
         if self._process.stdout is not None:
             self._stdout_fd = self._process.stdout.fileno()
+            os.set_blocking(self._stdout_fd, False)
+            _set_pipe_size(self._stdout_fd, self._chunk_bytes * _PIPE_CHUNKS)
+            self._poll = select.poll()
+            self._poll.register(self._stdout_fd, select.POLLIN)
+        if self._process.stderr is not None:
+            self._stderr_tail.clear()
+            self._stderr_thread = threading.Thread(
+                target=_drain_lines,
+                args=(self._process.stderr, self._stderr_tail),
+                name="whisperflow-capture-stderr",
+                daemon=True,
+            )
+            self._stderr_thread.start()
 
     def read(self, timeout: float | None = None) -> AudioChunk | None:
-        if self._process is None or self._process.stdout is None:
+        ready = self._ready
+        if ready:
+            return self._chunk(ready.popleft())
+        process = self._process
+        if process is None or process.stdout is None:
             return None
-        if self._process.poll() is not None:
-            stderr = ""
-            if self._process.stderr is not None:
-                stderr = (
-                    self._process.stderr.read()
-                    .decode("utf-8", errors="replace")
-                    .strip()
-                )
+        if process.poll() is not None:
+            if self._stderr_thread is not None:
+                self._stderr_thread.join(timeout=1.0)
+            stderr = (
+                b"".join(self._stderr_tail).decode("utf-8", errors="replace").strip()
+            )
             message = stderr or "Audio capture process exited unexpectedly."
             raise WhisperflowRuntimeError(message)
-        if self._stdout_fd is None:
+        stdout_fd = self._stdout_fd
+        poller = self._poll
+        if stdout_fd is None or poller is None:
             return None
-        if len(self._buffer) < self._chunk_bytes:
-            ready, _, _ = select.select([self._stdout_fd], [], [], timeout)
-            if not ready:
-                return None
+        spare = self._spare
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # The pipe is non-blocking: read first and only poll once it runs dry, so a
+        # backlogged pipe costs one syscall per batch instead of poll + read.
+        while not ready:
+            while len(spare) < _READ_BATCH_CHUNKS - 1:
+                spare.append(memoryview(self._pool.acquire()))
             try:
-                data = os.read(self._stdout_fd, self._chunk_bytes - len(self._buffer))
+                count = os.readv(stdout_fd, [self._chunk_view[self._filled :], *spare])
+            except BlockingIOError:
+                poll_timeout = None
+                if deadline is not None:
+                    poll_timeout = max(0.0, deadline - time.monotonic()) * 1000.0
+                if not poller.poll(poll_timeout):
+                    return None
+                continue
             except OSError as exc:
                 raise WhisperflowRuntimeError(
                     f"Failed to read audio capture output: {exc}"
                 ) from exc
-            if not data:
-                return None
-            self._buffer.extend(data)
-            if len(self._buffer) < self._chunk_bytes:
+            if not count:
                 return None
+            self._consume(count)
+
+        return self._chunk(ready.popleft())
 
-        data = bytes(self._buffer[: self._chunk_bytes])
-        del self._buffer[: self._chunk_bytes]
+    def _consume(self, count: int) -> None:
+        """Account for ``count`` bytes that readv spread across the chunk buffers."""
+        chunk_bytes = self._chunk_bytes
+        filled = self._filled + count
+        if filled < chunk_bytes:
+            self._filled = filled
+            return
+        ready = self._ready
+        spare = self._spare
+        view = self._chunk_view
+        while filled >= chunk_bytes:
+            ready.append(view.toreadonly())
+            view.release()
+            view = spare.popleft() if spare else memoryview(self._pool.acquire())
+            filled -= chunk_bytes
+        self._chunk_view = view
+        self._filled = filled
+
+    def _chunk(self, data: memoryview) -> AudioChunk:
         return AudioChunk(
             data=data, sample_rate=self._sample_rate, channels=self._channels
         )
 
+    def release(self, data: bytes | memoryview) -> None:
+        if not isinstance(data, memoryview):
+            return
+        buffer = data.obj
+        data.release()
+        if isinstance(buffer, bytearray):
+            self._pool.release(buffer)
+
     def stop(self) -> None:
         if self._process is None:
             return
@@ -736,8 +1073,13 @@ class _SubprocessCapture:
         except subprocess.TimeoutExpired:
             self._process.kill()
         self._stdout_fd = None
-        self._buffer.clear()
+        self._poll = None
+        self._filled = 0
+        self._ready.clear()
         self._process = None
+        if self._stderr_thread is not None:
+            self._stderr_thread.join(timeout=1.0)
+            self._stderr_thread = None
 
 
 __all__ = ["AudioCapture", "AudioChunk", "open_audio_capture", "open_output_capture"]
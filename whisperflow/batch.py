@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from whisperflow.config import apply_overrides
 from whisperflow.errors import WhisperflowRuntimeError, UserInputError
 from whisperflow.transcribe import SUPPORTED_AUDIO_EXTENSIONS, run_transcribe
 
@@ -19,13 +22,21 @@ def run_batch(input_dir: str, config: dict[str, Any], overrides: dict[str, Any])
     if not folder_path.is_dir():
         raise UserInputError(f"Input path is not a directory: {folder_path}")
 
-    entries = [path for path in sorted(folder_path.iterdir()) if path.is_file()]
-    audio_files = [
-        path for path in entries if path.suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS
-    ]
-    unsupported_files = [
-        path for path in entries if path.suffix.lower() not in SUPPORTED_AUDIO_EXTENSIONS
-    ]
+    audio_files: list[Path] = []
+    unsupported_files: list[Path] = []
+    # DirEntry.is_file() answers from the directory listing, so classifying the
+    # folder costs no per-file stat.
+    with os.scandir(folder_path) as scan:
+        for entry in scan:
+            if not entry.is_file():
+                continue
+            path = Path(entry.path)
+            if path.suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS:
+                audio_files.append(path)
+            else:
+                unsupported_files.append(path)
+    audio_files.sort()
+    unsupported_files.sort()
 
     successes: list[str] = []
     failures: list[str] = []
@@ -34,14 +45,34 @@ def run_batch(input_dir: str, config: dict[str, Any], overrides: dict[str, Any])
     for path in unsupported_files:
         logger.warning("Skipping unsupported file: %s", path)
 
-    for audio_path in audio_files:
+    # Merge and validate the overrides once for the whole folder, not per file.
+    merged = apply_overrides(config, overrides) if audio_files else config
+
+    def transcribe(audio_path: Path) -> list[str] | Exception:
         try:
-            output_files = run_transcribe(str(audio_path), config, overrides)
-            successes.extend(output_files)
-            logger.info("Transcribed: %s", audio_path)
+            output_files = run_transcribe(str(audio_path), merged, {})
         except (UserInputError, WhisperflowRuntimeError) as exc:
-            failures.append(f"{audio_path} ({exc})")
             logger.warning("Failed: %s (%s)", audio_path, exc)
+            return exc
+        logger.info("Transcribed: %s", audio_path)
+        return output_files
+
+    # Each file is a separate faster-whisper-gpu process, so threads are enough to
+    # overlap them; results are collected in folder order either way.
+    workers = min(int(merged.get("batch_workers", 1)), len(audio_files))
+    if workers > 1:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="whisperflow-batch"
+        ) as executor:
+            results = list(executor.map(transcribe, audio_files))
+    else:
+        results = [transcribe(audio_path) for audio_path in audio_files]
+
+    for audio_path, result in zip(audio_files, results):
+        if isinstance(result, Exception):
+            failures.append(f"{audio_path} ({result})")
+        else:
+            successes.extend(result)
 
     summary = {
         "successes": successes,
@@ -18,6 +18,7 @@ from whisperflow.errors import (
 from whisperflow.logging_utils import setup_logging
 
 DEFAULT_CONFIG_PATH = Path("config") / "config.json"
+_OVERRIDE_KEYS = ("model", "language", "task", "output_format", "output_dir")
 logger = logging.getLogger(__name__)
 
 
@@ -146,17 +147,11 @@ def _add_common_options(parser: argparse.ArgumentParser) -> None:
 
 
 def _collect_overrides(args: argparse.Namespace) -> dict[str, Any]:
-    overrides: dict[str, Any] = {}
-    if args.model is not None:
-        overrides["model"] = args.model
-    if args.language is not None:
-        overrides["language"] = args.language
-    if args.task is not None:
-        overrides["task"] = args.task
-    if args.output_format is not None:
-        overrides["output_format"] = args.output_format
-    if args.output_dir is not None:
-        overrides["output_dir"] = args.output_dir
+    overrides: dict[str, Any] = {
+        key: value
+        for key in _OVERRIDE_KEYS
+        if (value := getattr(args, key, None)) is not None
+    }
     include_output = getattr(args, "include_output", None)
     if include_output is not None:
         overrides["live_capture"] = {
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import shutil
 import subprocess
 import sys
@@ -22,23 +24,43 @@ def copy_to_clipboard(text: str, tool: str = "auto") -> bool:
     try:
         result = subprocess.run(
             command,
-            input=text,
-            text=True,
-            capture_output=True,
+            input=text.encode("utf-8"),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=False,
             timeout=2.0,
         )
+    except FileNotFoundError:
+        # The tool was removed since it was selected; look it up again next time.
+        _reset_tool_cache()
+        _warn(f"Clipboard tool {selected_tool} is no longer available.")
+        return False
     except subprocess.TimeoutExpired:
         _warn(f"Clipboard copy timed out using {selected_tool}.")
         return False
     if result.returncode != 0:
-        details = result.stderr.strip() or "unknown error"
+        details = result.stderr.decode("utf-8", errors="replace").strip()
+        details = details or "unknown error"
         _warn(f"Clipboard copy failed with {selected_tool}: {details}")
         return False
     return True
 
 
 def _select_tool(preferred: str) -> str | None:
+    tool = _select_tool_cached(preferred, os.environ.get("PATH", ""))
+    if tool is None:
+        # Misses are not kept, so a tool installed later is found on the next call.
+        _reset_tool_cache()
+    return tool
+
+
+def _reset_tool_cache() -> None:
+    """Forget cached clipboard tool lookups."""
+    _select_tool_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _select_tool_cached(preferred: str, _search_path: str) -> str | None:
     if preferred == "auto":
         for tool in TOOL_ORDER:
             if shutil.which(tool):
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
-import copy
-import json
+import threading
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Any
 
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    _orjson_dumps = None
+
 from whisperflow.errors import ConfigError
 
 ALLOWED_MODELS = {"small", "medium", "large-v3"}
@@ -15,6 +23,12 @@ ALLOWED_OUTPUT_FORMATS = {"txt", "srt", "vtt", "json"}
 ALLOWED_BACKENDS = {"auto", "sounddevice", "arecord", "pw-record"}
 ALLOWED_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
 
+# Serialized configs that already passed validation, most recent last.
+_VALIDATED_CACHE_SIZE = 32
+_VALIDATED: OrderedDict[bytes, None] = OrderedDict()
+_VALIDATED_LOCK = threading.Lock()
+
+# Merged configs share untouched subtrees with this dict; treat it as read-only.
 DEFAULT_CONFIG: dict[str, Any] = {
     "output_dir": "./output",
     "model": "small",
@@ -22,6 +36,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "task": "transcribe",
     "output_format": "txt",
     "batch": False,
+    "batch_workers": 1,
     "live_capture": {
         "enabled": True,
         "raw_transcript_filename": "live_raw.txt",
@@ -82,6 +97,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
             "enabled": True,
             "host": "127.0.0.1",
             "port": 8788,
+            "thread_pool": 32,
         },
     },
     "logging": {
@@ -96,11 +112,10 @@ def load_config(path: str) -> dict[str, Any]:
     """Load and validate the config file at the provided path."""
     config_path = Path(path)
     try:
-        with config_path.open("r", encoding="utf-8") as handle:
-            raw_config = json.load(handle)
+        raw_config = _json_loads(config_path.read_bytes())
     except FileNotFoundError as exc:
         raise ConfigError(f"Config file not found: {config_path}") from exc
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
         raise ConfigError(f"Config file is not valid JSON: {config_path}") from exc
 
     if not isinstance(raw_config, dict):
@@ -111,102 +126,88 @@ def load_config(path: str) -> dict[str, Any]:
     return merged
 
 
+def clone_config(
+    overrides: dict[str, Any] | None = None,
+    base: dict[str, Any] = DEFAULT_CONFIG,
+) -> dict[str, Any]:
+    """Return a copy of ``base`` with ``overrides`` merged in, without validating.
+
+    Only the branches named in ``overrides`` are copied; everything else is shared
+    with ``base``, so mutate the result only along those branches.
+    """
+    return _merge_dicts(base, overrides or {})
+
+
 def apply_overrides(
     config: dict[str, Any], overrides: dict[str, Any] | None
 ) -> dict[str, Any]:
     """Merge CLI overrides into an existing config dictionary."""
     if overrides is None:
-        return copy.deepcopy(config)
+        return dict(config)
     if not isinstance(overrides, dict):
         raise ConfigError("Overrides must be provided as a dictionary.")
     merged = _merge_dicts(config, overrides)
-    _validate_config(merged)
+    _validate_config_cached(merged)
     return merged
 
 
+def _validate_config_cached(config: dict[str, Any]) -> None:
+    """Validate ``config`` unless an identical config already passed validation.
+
+    The cache key is the orjson serialization, which is several times cheaper than
+    a validation walk; without orjson building the key would cost more than it
+    saves, so every call validates.
+    """
+    if _orjson_dumps is None:
+        _validate_config(config)
+        return
+    try:
+        key = _orjson_dumps(config)
+    except TypeError:
+        _validate_config(config)
+        return
+    with _VALIDATED_LOCK:
+        if key in _VALIDATED:
+            _VALIDATED.move_to_end(key)
+            return
+    _validate_config(config)
+    with _VALIDATED_LOCK:
+        _VALIDATED[key] = None
+        while len(_VALIDATED) > _VALIDATED_CACHE_SIZE:
+            _VALIDATED.popitem(last=False)
+
+
 def _merge_dicts(defaults: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
-    merged = copy.deepcopy(defaults)
-    for key, value in overrides.items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = _merge_dicts(merged[key], value)
-        else:
-            merged[key] = value
+    """Merge ``overrides`` into a copy of ``defaults``.
+
+    Only the branches touched by ``overrides`` are copied; untouched subtrees are
+    shared with ``defaults`` by reference, so callers must not mutate them.
+    """
+    merged = dict(defaults)
+    stack = deque([(merged, overrides)])
+    while stack:
+        node, override_node = stack.pop()
+        for key, value in override_node.items():
+            current = node.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                node[key] = dict(current)
+                stack.append((node[key], value))
+            else:
+                node[key] = value
     return merged
 
 
 def _validate_config(config: dict[str, Any]) -> None:
-    _validate_str(config, "output_dir")
-    _validate_str(config, "model", allowed=ALLOWED_MODELS)
-    _validate_str(config, "language")
-    _validate_str(config, "task", allowed=ALLOWED_TASKS)
-    _validate_str(config, "output_format", allowed=ALLOWED_OUTPUT_FORMATS)
-    _validate_bool(config, "batch")
-
-    live_capture = _require_dict(config, "live_capture")
-    _validate_bool(live_capture, "enabled")
-    _validate_str(live_capture, "raw_transcript_filename")
-    _validate_str(live_capture, "final_transcript_filename")
-    _validate_str(live_capture, "output_raw_transcript_filename")
-    _validate_str(live_capture, "output_final_transcript_filename")
-    _validate_str(live_capture, "backend", allowed=ALLOWED_BACKENDS)
-
-    audio = _require_dict(live_capture, "audio")
-    _validate_device(audio, "device")
-    _validate_int(audio, "sample_rate", min_value=1)
-    _validate_int(audio, "channels", min_value=1)
-    _validate_int(audio, "chunk_ms", min_value=1)
-    _validate_bool(audio, "include_output")
-
-    vad = _require_dict(live_capture, "vad")
-    _validate_bool(vad, "enabled")
-    _validate_int(vad, "silence_ms", min_value=1)
-    _validate_int(vad, "min_speech_ms", min_value=1)
-    _validate_float(vad, "energy_threshold", min_value=0)
-    _validate_int(vad, "max_buffer_ms", min_value=1)
-
-    output_vad = _require_dict(live_capture, "output_vad")
-    _validate_bool(output_vad, "enabled")
-    _validate_int(output_vad, "silence_ms", min_value=1)
-    _validate_int(output_vad, "min_speech_ms", min_value=1)
-    _validate_float(output_vad, "energy_threshold", min_value=0)
-    _validate_int(output_vad, "max_buffer_ms", min_value=1)
-
-    postprocess = _require_dict(config, "postprocess")
-    _validate_bool(postprocess, "enabled")
-    _validate_str(postprocess, "provider")
-    _validate_str(postprocess, "profile")
-
-    mixing = _require_dict(config, "mixing")
-    _validate_bool(mixing, "enabled")
-    _validate_str(mixing, "ollama_model")
-    _validate_bool(mixing, "unload_on_start")
-
-    clipboard = _require_dict(config, "clipboard")
-    _validate_bool(clipboard, "enabled")
-    _validate_str(clipboard, "tool")
-
-    web_config = _require_dict(config, "web")
-    _validate_bool(web_config, "enabled")
-    _validate_str(web_config, "host")
-    _validate_port(web_config, "port")
-
-    tray_config = _require_dict(config, "tray")
-    _validate_bool(tray_config, "enabled")
-    _validate_str(tray_config, "icon")
-    _validate_str(tray_config, "tooltip")
-
-    archive_config = _require_dict(config, "archive")
-    _validate_bool(archive_config, "enabled")
-    _validate_str(archive_config, "dir_name")
-    archive_web = _require_dict(archive_config, "web")
-    _validate_bool(archive_web, "enabled")
-    _validate_str(archive_web, "host")
-    _validate_port(archive_web, "port")
-
-    logging_config = _require_dict(config, "logging")
-    _validate_str(logging_config, "level", allowed=ALLOWED_LOG_LEVELS)
-    _validate_bool(logging_config, "console")
-    _validate_optional_str(logging_config, "file")
+    _validate_section(config, _CONFIG_SCHEMA)
+
+
+def _validate_section(node: dict[str, Any], schema: dict[str, Any]) -> None:
+    for key, rule in schema.items():
+        if isinstance(rule, dict):
+            _validate_section(_require_dict(node, key), rule)
+        else:
+            validator, options = rule
+            validator(node, key, **options)
 
 
 def _require_dict(parent: dict[str, Any], key: str) -> dict[str, Any]:
@@ -278,3 +279,82 @@ def _validate_device(parent: dict[str, Any], key: str) -> None:
     if isinstance(value, (str, int)):
         return
     raise ConfigError(f"Config key '{key}' must be a string or integer.")
+
+
+def _vad_schema() -> dict[str, Any]:
+    return {
+        "enabled": (_validate_bool, {}),
+        "silence_ms": (_validate_int, {"min_value": 1}),
+        "min_speech_ms": (_validate_int, {"min_value": 1}),
+        "energy_threshold": (_validate_float, {"min_value": 0}),
+        "max_buffer_ms": (_validate_int, {"min_value": 1}),
+    }
+
+
+# Declarative shape of a valid config: leaves are ``(validator, options)`` pairs
+# and nested dicts are required objects. Keys are checked in declaration order.
+_CONFIG_SCHEMA: dict[str, Any] = {
+    "output_dir": (_validate_str, {}),
+    "model": (_validate_str, {"allowed": ALLOWED_MODELS}),
+    "language": (_validate_str, {}),
+    "task": (_validate_str, {"allowed": ALLOWED_TASKS}),
+    "output_format": (_validate_str, {"allowed": ALLOWED_OUTPUT_FORMATS}),
+    "batch": (_validate_bool, {}),
+    "batch_workers": (_validate_int, {"min_value": 1}),
+    "live_capture": {
+        "enabled": (_validate_bool, {}),
+        "raw_transcript_filename": (_validate_str, {}),
+        "final_transcript_filename": (_validate_str, {}),
+        "output_raw_transcript_filename": (_validate_str, {}),
+        "output_final_transcript_filename": (_validate_str, {}),
+        "backend": (_validate_str, {"allowed": ALLOWED_BACKENDS}),
+        "audio": {
+            "device": (_validate_device, {}),
+            "sample_rate": (_validate_int, {"min_value": 1}),
+            "channels": (_validate_int, {"min_value": 1}),
+            "chunk_ms": (_validate_int, {"min_value": 1}),
+            "include_output": (_validate_bool, {}),
+        },
+        "vad": _vad_schema(),
+        "output_vad": _vad_schema(),
+    },
+    "postprocess": {
+        "enabled": (_validate_bool, {}),
+        "provider": (_validate_str, {}),
+        "profile": (_validate_str, {}),
+    },
+    "mixing": {
+        "enabled": (_validate_bool, {}),
+        "ollama_model": (_validate_str, {}),
+        "unload_on_start": (_validate_bool, {}),
+    },
+    "clipboard": {
+        "enabled": (_validate_bool, {}),
+        "tool": (_validate_str, {}),
+    },
+    "web": {
+        "enabled": (_validate_bool, {}),
+        "host": (_validate_str, {}),
+        "port": (_validate_port, {}),
+    },
+    "tray": {
+        "enabled": (_validate_bool, {}),
+        "icon": (_validate_str, {}),
+        "tooltip": (_validate_str, {}),
+    },
+    "archive": {
+        "enabled": (_validate_bool, {}),
+        "dir_name": (_validate_str, {}),
+        "web": {
+            "enabled": (_validate_bool, {}),
+            "host": (_validate_str, {}),
+            "port": (_validate_port, {}),
+            "thread_pool": (_validate_int, {"min_value": 1}),
+        },
+    },
+    "logging": {
+        "level": (_validate_str, {"allowed": ALLOWED_LOG_LEVELS}),
+        "console": (_validate_bool, {}),
+        "file": (_validate_optional_str, {}),
+    },
+}
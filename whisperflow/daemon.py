@@ -6,16 +6,25 @@ import argparse
 import logging
 import json
 import os
+import select
 import signal
 import subprocess
 import sys
 import threading
 import time
+import traceback
 from datetime import datetime, timezone
 from http.server import ThreadingHTTPServer
 from pathlib import Path
 from typing import Any, Sequence
 
+try:
+    from orjson import dumps as _dumps_state
+except ImportError:
+
+    def _dumps_state(state: dict[str, Any]) -> bytes:
+        return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
 from whisperflow.clipboard import copy_to_clipboard
 from whisperflow.config import load_config
 from whisperflow.errors import WhisperflowRuntimeError
@@ -34,6 +43,7 @@ PID_PATH = RUN_DIR / "whisperflow.pid"
 STATE_PATH = RUN_DIR / "whisperflow.state.json"
 CONFIG_PATH = RUN_DIR / "whisperflow.config.json"
 LOG_PATH = RUN_DIR / "whisperflow.log"
+STATE_FLUSH_INTERVAL_S = 0.05
 logger = logging.getLogger(__name__)
 
 
@@ -55,17 +65,64 @@ def start_daemon(config: dict[str, Any]) -> None:
     _cleanup_stale_files()
     _write_json(CONFIG_PATH, config)
 
-    with LOG_PATH.open("a", encoding="utf-8") as log_handle:
-        process = subprocess.Popen(
-            [sys.executable, "-m", "whisperflow.daemon", "--config", str(CONFIG_PATH)],
-            stdout=log_handle,
-            stderr=log_handle,
-            start_new_session=True,
-        )
+    if hasattr(os, "fork"):
+        pid = _fork_daemon()
+    else:
+        with LOG_PATH.open("a", encoding="utf-8") as log_handle:
+            process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "whisperflow.daemon",
+                    "--config",
+                    str(CONFIG_PATH),
+                ],
+                stdout=log_handle,
+                stderr=log_handle,
+                start_new_session=True,
+            )
+        pid = process.pid
 
-    if not _wait_for_daemon_ready(process.pid):
+    if not _wait_for_daemon_ready(pid):
         raise WhisperflowRuntimeError(f"Daemon failed to start. Check log: {LOG_PATH}")
-    print(f"Daemon started (pid {process.pid}).")
+    print(f"Daemon started (pid {pid}).")
+
+
+def _fork_daemon() -> int:
+    """Run the daemon in a forked child and return its pid.
+
+    The CLI has already imported this module and its capture dependencies, so
+    the child starts from those parsed modules instead of a fresh interpreter.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    log_fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        pid = os.fork()
+    except OSError:
+        os.close(log_fd)
+        raise
+    if pid:
+        os.close(log_fd)
+        return pid
+
+    exit_code = 1
+    try:
+        os.setsid()
+        null_fd = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null_fd, 0)
+        os.dup2(log_fd, 1)
+        os.dup2(log_fd, 2)
+        os.close(null_fd)
+        os.close(log_fd)
+        _run_daemon(CONFIG_PATH)
+        exit_code = 0
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
 
 
 def stop_daemon(_config: dict[str, Any]) -> None:
@@ -141,95 +198,105 @@ def _run_daemon(config_path: Path) -> None:
 
     _write_pid()
     _write_state(state)
+    state_writer = _StateWriter(state, state_lock)
 
     def update_state(**updates: Any) -> None:
         with state_lock:
             state.update(updates)
-            _write_state(state)
-
-    dashboard: LiveDashboard | None = None
-    web_server: ThreadingHTTPServer | None = None
-    web_config = config.get("web", {})
-    if isinstance(web_config, dict) and web_config.get("enabled", False):
-        dashboard = LiveDashboard(config)
-        host = web_config.get("host", "127.0.0.1")
-        port = int(web_config.get("port", 8787))
-        try:
-            web_server = start_dashboard_server(dashboard, stop_event, host, port)
-            update_state(web_url=f"http://{host}:{port}")
-        except OSError as exc:
-            logger.warning("Failed to start dashboard on %s:%s: %s", host, port, exc)
-            update_state(web_error=str(exc))
-            dashboard = None
+        state_writer.mark_dirty()
 
-    include_output = (
-        config.get("live_capture", {}).get("audio", {}).get("include_output", False)
-    )
-    tray_thread: threading.Thread | None = None
-    tray_config = config.get("tray", {})
-    notify_icon: str | None = None
-    if isinstance(tray_config, dict) and tray_config.get("enabled", False):
-        tooltip = tray_config.get("tooltip", "Whisperflow: Recording")
-        icon_name = tray_config.get("icon", "media-record")
-        notify_icon, _ = resolve_tray_icon(icon_name)
-        tray_thread = start_tray_indicator(
-            stop_event, tooltip=tooltip, icon_name=icon_name
+    # Updates are only marked dirty, so the writer must get its final flush even
+    # when startup or shutdown fails part way.
+    try:
+        dashboard: LiveDashboard | None = None
+        web_server: ThreadingHTTPServer | None = None
+        web_config = config.get("web", {})
+        if isinstance(web_config, dict) and web_config.get("enabled", False):
+            dashboard = LiveDashboard(config)
+            host = web_config.get("host", "127.0.0.1")
+            port = int(web_config.get("port", 8787))
+            try:
+                web_server = start_dashboard_server(dashboard, stop_event, host, port)
+                update_state(web_url=f"http://{host}:{port}")
+            except OSError as exc:
+                logger.warning(
+                    "Failed to start dashboard on %s:%s: %s", host, port, exc
+                )
+                update_state(web_error=str(exc))
+                dashboard = None
+
+        include_output = (
+            config.get("live_capture", {}).get("audio", {}).get("include_output", False)
         )
-        send_notification("Whisperflow", "Recording started.", icon=notify_icon)
-
-    def capture_worker() -> None:
-        try:
-            update_state(status="running")
-            run_live_capture(config, {}, stop_event, dashboard)
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Capture worker crashed: %s", exc)
-            update_state(status="error", last_error=str(exc))
-            stop_event.set()
-
-    def output_worker() -> None:
-        try:
-            run_output_capture(config, {}, stop_event, dashboard)
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Output capture worker crashed: %s", exc)
-            update_state(output_error=str(exc))
-
-    capture_thread = threading.Thread(target=capture_worker, name="whisperflow-capture")
-    capture_thread.start()
-
-    output_thread: threading.Thread | None = None
-    if include_output:
-        output_thread = threading.Thread(
-            target=output_worker, name="whisperflow-output-capture"
+        tray_thread: threading.Thread | None = None
+        tray_config = config.get("tray", {})
+        notify_icon: str | None = None
+        if isinstance(tray_config, dict) and tray_config.get("enabled", False):
+            tooltip = tray_config.get("tooltip", "Whisperflow: Recording")
+            icon_name = tray_config.get("icon", "media-record")
+            notify_icon, _ = resolve_tray_icon(icon_name)
+            tray_thread = start_tray_indicator(
+                stop_event, tooltip=tooltip, icon_name=icon_name
+            )
+            send_notification("Whisperflow", "Recording started.", icon=notify_icon)
+
+        def capture_worker() -> None:
+            try:
+                update_state(status="running")
+                run_live_capture(config, {}, stop_event, dashboard)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Capture worker crashed: %s", exc)
+                update_state(status="error", last_error=str(exc))
+                stop_event.set()
+
+        def output_worker() -> None:
+            try:
+                run_output_capture(config, {}, stop_event, dashboard)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Output capture worker crashed: %s", exc)
+                update_state(output_error=str(exc))
+
+        capture_thread = threading.Thread(
+            target=capture_worker, name="whisperflow-capture"
         )
-        output_thread.start()
-
-    def handle_request(message: dict[str, Any]) -> dict[str, Any]:
-        command = message.get("command")
-        if command == "stop":
-            update_state(status="stopping")
-            logger.info("Stop request received.")
-            stop_event.set()
-            return {"ok": True, "message": "Stopping daemon."}
-        if command == "status":
-            return {"ok": True, "state": state}
-        return {"ok": False, "error": f"Unknown command: {command}"}
-
-    _install_signal_handlers(stop_event)
-    serve(SOCKET_PATH, stop_event, handle_request)
-
-    capture_thread.join()
-    if output_thread:
-        output_thread.join()
-    if web_server:
-        web_server.server_close()
-    if tray_thread:
-        tray_thread.join(timeout=1)
-    mixed_text = _finalize_transcript(state, config, update_state, notify_icon)
-    if include_output:
-        _finalize_output_transcript(state, update_state)
-    _cleanup_retranscribed_dirs(state, update_state)
-    _archive_transcripts(state, config, mixed_text, update_state)
-    update_state(status="stopped", stopped_at=_now_iso())
+        capture_thread.start()
+
+        output_thread: threading.Thread | None = None
+        if include_output:
+            output_thread = threading.Thread(
+                target=output_worker, name="whisperflow-output-capture"
+            )
+            output_thread.start()
+
+        def handle_request(message: dict[str, Any]) -> dict[str, Any]:
+            command = message.get("command")
+            if command == "stop":
+                update_state(status="stopping")
+                logger.info("Stop request received.")
+                stop_event.set()
+                return {"ok": True, "message": "Stopping daemon."}
+            if command == "status":
+                return {"ok": True, "state": state}
+            return {"ok": False, "error": f"Unknown command: {command}"}
+
+        _install_signal_handlers(stop_event)
+        serve(SOCKET_PATH, stop_event, handle_request)
+
+        capture_thread.join()
+        if output_thread:
+            output_thread.join()
+        if web_server:
+            web_server.server_close()
+        if tray_thread:
+            tray_thread.join(timeout=1)
+        mixed_text = _finalize_transcript(state, config, update_state, notify_icon)
+        if include_output:
+            _finalize_output_transcript(state, update_state)
+        _cleanup_retranscribed_dirs(state, update_state)
+        _archive_transcripts(state, config, mixed_text, update_state)
+        update_state(status="stopped", stopped_at=_now_iso())
+    finally:
+        state_writer.close()
     if notify_icon:
         send_notification("Whisperflow", "Recording stopped.", icon=notify_icon)
     logger.info("Daemon stopped.")
@@ -237,6 +304,60 @@ def _run_daemon(config_path: Path) -> None:
     _remove_pid()
 
 
+class _StateWriter:
+    """Write the state file from a background thread, coalescing bursts.
+
+    ``mark_dirty`` only sets an event; the writer waits ``interval`` after the
+    first change so a run of updates lands in one temp-file write and rename.
+    ``close`` writes any pending changes and stops the thread.
+    """
+
+    def __init__(
+        self,
+        state: dict[str, Any],
+        lock: threading.Lock,
+        interval: float = STATE_FLUSH_INTERVAL_S,
+    ) -> None:
+        self._state = state
+        self._lock = lock
+        self._interval = interval
+        self._dirty = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="whisperflow-state-writer", daemon=True
+        )
+        self._thread.start()
+
+    def mark_dirty(self) -> None:
+        self._dirty.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._dirty.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._dirty.wait()
+            if self._closed:
+                break
+            time.sleep(self._interval)
+            # close() may have been called during the sleep; clearing the event
+            # then would swallow its wakeup, so leave straight for the final flush.
+            if self._closed:
+                break
+            self._dirty.clear()
+            self._flush()
+        self._flush()
+
+    def _flush(self) -> None:
+        try:
+            with self._lock:
+                _write_state(self._state)
+        except OSError as exc:
+            logger.warning("Failed to write daemon state: %s", exc)
+
+
 def _build_state(config: dict[str, Any]) -> dict[str, Any]:
     live = config["live_capture"]
     audio = live["audio"]
@@ -485,27 +606,39 @@ def _cleanup_stale_files() -> None:
 
 def _daemon_running() -> bool:
     pid = _read_pid()
-    if pid is None:
-        return False
-    try:
-        os.kill(pid, 0)
-    except ProcessLookupError:
-        return False
-    except PermissionError:
-        return True
-    return True
+    return pid is not None and _pid_running(pid)
 
 
 def _wait_for_daemon_ready(pid: int, timeout: float = 5.0) -> bool:
     deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        if SOCKET_PATH.exists() and _pid_running(pid):
-            return True
-        time.sleep(0.1)
-    return False
+    pidfd = _open_pidfd(pid)
+    try:
+        while time.monotonic() < deadline:
+            if SOCKET_PATH.exists() and _pid_running(pid):
+                return True
+            if pidfd is None:
+                time.sleep(0.1)
+            elif _wait_readable(pidfd, 0.1):
+                # The daemon exited before its socket appeared.
+                return False
+        return False
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
 
 
 def _wait_for_daemon_exit(timeout: float = 5.0) -> bool:
+    pid = _read_pid()
+    pidfd = _open_pidfd(pid) if pid is not None else None
+    if pidfd is not None:
+        # A pidfd becomes readable when the process exits, so one wait replaces
+        # the polling loop below.
+        try:
+            _wait_readable(pidfd, timeout)
+        finally:
+            os.close(pidfd)
+        return not _daemon_running()
+
     deadline = time.monotonic() + timeout
     while time.monotonic() < deadline:
         if not _daemon_running():
@@ -514,7 +647,24 @@ def _wait_for_daemon_exit(timeout: float = 5.0) -> bool:
     return False
 
 
+def _open_pidfd(pid: int) -> int | None:
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _wait_readable(fd: int, timeout: float) -> bool:
+    readable, _, _ = select.select([fd], [], [], timeout)
+    return bool(readable)
+
+
 def _pid_running(pid: int) -> bool:
+    # Signal 0 is checked but never delivered, so this is one syscall, the same
+    # as a stat of /proc/<pid>, and it also works where /proc is hidden.
     try:
         os.kill(pid, 0)
     except ProcessLookupError:
@@ -526,13 +676,25 @@ def _pid_running(pid: int) -> bool:
 
 def _read_pid() -> int | None:
     try:
-        return int(PID_PATH.read_text(encoding="utf-8").strip())
-    except (FileNotFoundError, ValueError):
+        fd = os.open(PID_PATH, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        data = os.read(fd, 32)
+    finally:
+        os.close(fd)
+    try:
+        return int(data.strip())
+    except ValueError:
         return None
 
 
 def _write_pid() -> None:
-    PID_PATH.write_text(str(os.getpid()), encoding="utf-8")
+    fd = os.open(PID_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b"%d" % os.getpid())
+    finally:
+        os.close(fd)
 
 
 def _remove_pid() -> None:
@@ -552,10 +714,17 @@ def _read_state() -> dict[str, Any]:
 
 
 def _write_state(state: dict[str, Any]) -> None:
+    # Compact JSON in a single write(); show_status does the human formatting.
+    data = _dumps_state(state)
     tmp_path = STATE_PATH.with_suffix(".tmp")
-    with tmp_path.open("w", encoding="utf-8") as handle:
-        json.dump(state, handle, indent=2)
-    tmp_path.replace(STATE_PATH)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, STATE_PATH)
 
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
+import selectors
 import socket
+import struct
 import threading
 from pathlib import Path
 from typing import Any, Callable
@@ -13,6 +16,11 @@ from whisperflow.errors import WhisperflowRuntimeError
 IPCMessage = dict[str, Any]
 IPCHandler = Callable[[IPCMessage], IPCMessage]
 
+# Every message is a 4-byte big-endian length followed by that many bytes of JSON,
+# so neither side has to half-close the socket to mark the end of a message.
+_FRAME_HEADER = struct.Struct("!I")
+_MAX_FRAME_BYTES = 1 << 20
+
 
 def send_command(socket_path: Path, command: str, payload: IPCMessage | None = None) -> IPCMessage:
     """Send a command to the daemon over a Unix socket."""
@@ -26,9 +34,8 @@ def send_command(socket_path: Path, command: str, payload: IPCMessage | None = N
         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
             client.settimeout(2.0)
             client.connect(str(socket_path))
-            client.sendall(encoded)
-            client.shutdown(socket.SHUT_WR)
-            response = _recv_all(client)
+            _send_frame(client, encoded)
+            response = _recv_frame(client)
     except (OSError, json.JSONDecodeError) as exc:
         raise WhisperflowRuntimeError(f"Failed to communicate with daemon at {socket_path}.") from exc
 
@@ -46,27 +53,62 @@ def serve(socket_path: Path, stop_event: threading.Event, handler: IPCHandler) -
     if socket_path.exists():
         socket_path.unlink()
 
-    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
-        server.bind(str(socket_path))
-        server.listen(5)
-        server.settimeout(0.5)
-        while not stop_event.is_set():
-            try:
-                connection, _ = server.accept()
-            except TimeoutError:
-                continue
-            except OSError:
-                continue
-            with connection:
-                response = _handle_connection(connection, handler)
-                try:
-                    connection.sendall(response)
-                except OSError:
-                    continue
+    # The loop blocks in select() until a client connects or the wakeup pipe
+    # becomes readable; a helper thread writes to it once stop_event is set.
+    wakeup_read, wakeup_write = os.pipe()
+    waiter = threading.Thread(
+        target=_wake_on_stop,
+        args=(stop_event, wakeup_write),
+        name="whisperflow-ipc-wakeup",
+        daemon=True,
+    )
+    selector = selectors.DefaultSelector()
+    with selector, socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        try:
+            server.bind(str(socket_path))
+            server.listen(5)
+            server.setblocking(False)
+            selector.register(server, selectors.EVENT_READ)
+            selector.register(wakeup_read, selectors.EVENT_READ)
+            waiter.start()
+            while not stop_event.is_set():
+                for key, _ in selector.select():
+                    if key.fileobj is server:
+                        _accept_and_handle(server, handler)
+        finally:
+            # A failing server loop also stops the workers waiting on the event.
+            stop_event.set()
+            if waiter.ident is None:
+                os.close(wakeup_write)
+            else:
+                waiter.join()
+            os.close(wakeup_read)
+
+
+def _wake_on_stop(stop_event: threading.Event, wakeup_fd: int) -> None:
+    stop_event.wait()
+    try:
+        os.write(wakeup_fd, b"\0")
+    finally:
+        os.close(wakeup_fd)
+
+
+def _accept_and_handle(server: socket.socket, handler: IPCHandler) -> None:
+    try:
+        connection, _ = server.accept()
+    except OSError:
+        return
+    with connection:
+        connection.setblocking(True)
+        try:
+            response = _handle_connection(connection, handler)
+            _send_frame(connection, response)
+        except OSError:
+            return
 
 
 def _handle_connection(connection: socket.socket, handler: IPCHandler) -> bytes:
-    data = _recv_all(connection)
+    data = _recv_frame(connection)
     try:
         request = json.loads(data.decode("utf-8"))
     except json.JSONDecodeError:
@@ -83,14 +125,27 @@ def _handle_connection(connection: socket.socket, handler: IPCHandler) -> bytes:
     return json.dumps(response).encode("utf-8")
 
 
-def _recv_all(connection: socket.socket) -> bytes:
-    chunks: list[bytes] = []
-    while True:
-        data = connection.recv(4096)
-        if not data:
-            break
-        chunks.append(data)
-    return b"".join(chunks)
+def _send_frame(connection: socket.socket, payload: bytes) -> None:
+    connection.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_frame(connection: socket.socket) -> bytes:
+    (size,) = _FRAME_HEADER.unpack(_recv_exact(connection, _FRAME_HEADER.size))
+    if size > _MAX_FRAME_BYTES:
+        raise ConnectionError(f"IPC frame of {size} bytes exceeds the size limit.")
+    return bytes(_recv_exact(connection, size))
+
+
+def _recv_exact(connection: socket.socket, size: int) -> bytearray:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = connection.recv_into(view[received:])
+        if not count:
+            raise ConnectionError("IPC connection closed mid-frame.")
+        received += count
+    return buffer
 
 
 __all__ = ["send_command", "serve"]
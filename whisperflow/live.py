@@ -4,13 +4,28 @@ from __future__ import annotations
 
 import logging
 import math
+import operator
+import os
 import threading
 import time
 import wave
-from array import array
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, TextIO
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_HAS_NUMPY = np is not None
+_PCM16 = np.dtype("<i2") if _HAS_NUMPY else None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 from whisperflow.audio import AudioChunk, open_audio_capture, open_output_capture
 from whisperflow.config import apply_overrides
@@ -21,6 +36,15 @@ from whisperflow.web_dashboard import LiveDashboard
 
 logger = logging.getLogger(__name__)
 
+_MAX_DRAIN_BATCH = 8
+_CAPTURE_NICENESS = -10
+# Per-thread record of what _boost_capture_thread changed, so _unboosted can put
+# the original scheduling back while a transcription subprocess runs.
+_BOOST_STATE = threading.local()
+_LAST_TIMESTAMP: tuple[int, str] = (-1, "")
+_SILENCE_CACHE_SIZE = 8
+_SILENCE_CACHE: dict[int, bytes] = {}
+
 
 def run_live_capture(
     config: dict[str, Any],
@@ -45,6 +69,7 @@ def run_live_capture(
     _backup_existing_dir(segments_dir)
 
     segments_dir.mkdir(parents=True, exist_ok=True)
+    _boost_capture_thread()
 
     capture = open_audio_capture(
         live_config["backend"],
@@ -54,7 +79,8 @@ def run_live_capture(
         audio_config["chunk_ms"],
     )
 
-    buffer_chunks: list[bytes] = []
+    release = getattr(capture, "release", None)
+    audio_buffer: _RingBuffer | None = None
     buffer_ms = 0.0
     silence_ms = 0.0
     speech_ms = 0.0
@@ -71,109 +97,123 @@ def run_live_capture(
         audio_config["chunk_ms"],
     )
 
+    raw_transcript: TextIO | None = None
     capture.start()
     if dashboard:
         dashboard.set_status("listening")
+    stop_requested = stop_event.is_set
     try:
-        while not stop_event.is_set():
-            chunk = capture.read(timeout=0.25)
-            if chunk is None:
-                continue
-            active_sample_rate = chunk.sample_rate
-            active_channels = chunk.channels
-            chunk_duration = _chunk_duration_ms(chunk)
-            buffer_chunks.append(chunk.data)
-            buffer_ms += chunk_duration
-
-            if vad_config["enabled"]:
-                energy = _rms_energy(chunk.data)
-                if energy < vad_config["energy_threshold"]:
-                    silence_ms += chunk_duration
-                else:
-                    silence_ms = 0.0
-                    speech_ms += chunk_duration
+        raw_transcript = raw_transcript_path.open("a", encoding="utf-8", buffering=1)
+        while not stop_requested():
+            for chunk in _drain(capture, timeout=0.25):
+                active_sample_rate = chunk.sample_rate
+                active_channels = chunk.channels
+                chunk_duration = _chunk_duration_ms(chunk)
+                energy = _rms_energy(chunk.data) if vad_config["enabled"] else 0.0
+                if audio_buffer is None:
+                    audio_buffer = _RingBuffer(
+                        _ms_to_bytes(
+                            vad_config["max_buffer_ms"],
+                            chunk.sample_rate,
+                            chunk.channels,
+                        )
+                        + len(chunk.data)
+                    )
+                audio_buffer.write(chunk.data)
+                if release is not None:
+                    release(chunk.data)
+                buffer_ms = _buffer_duration_ms(
+                    len(audio_buffer), chunk.sample_rate, chunk.channels
+                )
 
-                if buffer_ms >= vad_config["max_buffer_ms"]:
-                    if speech_ms >= vad_config["min_speech_ms"]:
+                if vad_config["enabled"]:
+                    if energy < vad_config["energy_threshold"]:
+                        silence_ms += chunk_duration
+                    else:
+                        silence_ms = 0.0
+                        speech_ms += chunk_duration
+
+                    if buffer_ms >= vad_config["max_buffer_ms"]:
+                        if speech_ms >= vad_config["min_speech_ms"]:
+                            segment_index = _flush_buffer(
+                                audio_buffer.drain(),
+                                chunk.sample_rate,
+                                chunk.channels,
+                                segments_dir,
+                                merged,
+                                segment_index,
+                                raw_transcript,
+                                dashboard,
+                            )
+                            logger.info(
+                                "Flushed live segment %s (max buffer)", segment_index
+                            )
+                            buffer_ms = 0.0
+                            silence_ms = 0.0
+                            speech_ms = 0.0
+                            continue
+                        buffer_ms = _trim_buffer(
+                            audio_buffer,
+                            vad_config["max_buffer_ms"],
+                            chunk.sample_rate,
+                            chunk.channels,
+                        )
+
+                    if (
+                        silence_ms >= vad_config["silence_ms"]
+                        and speech_ms >= vad_config["min_speech_ms"]
+                    ):
                         segment_index = _flush_buffer(
-                            buffer_chunks,
+                            audio_buffer.drain(),
                             chunk.sample_rate,
                             chunk.channels,
                             segments_dir,
                             merged,
                             segment_index,
-                            raw_transcript_path,
+                            raw_transcript,
                             dashboard,
                         )
-                        logger.info("Flushed live segment %s (max buffer)", segment_index)
-                        buffer_chunks = []
+
+                        logger.info("Flushed live segment %s", segment_index)
+                        buffer_ms = 0.0
+                        silence_ms = 0.0
+                        speech_ms = 0.0
+                else:
+                    if buffer_ms >= vad_config["max_buffer_ms"]:
+                        segment_index = _flush_buffer(
+                            audio_buffer.drain(),
+                            chunk.sample_rate,
+                            chunk.channels,
+                            segments_dir,
+                            merged,
+                            segment_index,
+                            raw_transcript,
+                            dashboard,
+                        )
+                        logger.info("Flushed live segment %s", segment_index)
                         buffer_ms = 0.0
                         silence_ms = 0.0
                         speech_ms = 0.0
-                        continue
-                    buffer_chunks, buffer_ms = _trim_buffer(
-                        buffer_chunks,
-                        buffer_ms,
-                        vad_config["max_buffer_ms"],
-                        chunk.sample_rate,
-                        chunk.channels,
-                    )
-
-                if (
-                    silence_ms >= vad_config["silence_ms"]
-                    and speech_ms >= vad_config["min_speech_ms"]
-                ):
-                    segment_index = _flush_buffer(
-                        buffer_chunks,
-                        chunk.sample_rate,
-                        chunk.channels,
-                        segments_dir,
-                        merged,
-                        segment_index,
-                        raw_transcript_path,
-                        dashboard,
-                    )
-
-                    logger.info("Flushed live segment %s", segment_index)
-                    buffer_chunks = []
-                    buffer_ms = 0.0
-                    silence_ms = 0.0
-                    speech_ms = 0.0
-            else:
-                if buffer_ms >= vad_config["max_buffer_ms"]:
-                    segment_index = _flush_buffer(
-                        buffer_chunks,
-                        chunk.sample_rate,
-                        chunk.channels,
-                        segments_dir,
-                        merged,
-                        segment_index,
-                        raw_transcript_path,
-                        dashboard,
-                    )
-                    logger.info("Flushed live segment %s", segment_index)
-                    buffer_chunks = []
-                    buffer_ms = 0.0
-                    silence_ms = 0.0
-                    speech_ms = 0.0
     finally:
         try:
-            should_flush = buffer_chunks and (
+            should_flush = audio_buffer and (
                 not vad_config["enabled"] or speech_ms >= vad_config["min_speech_ms"]
             )
             if should_flush:
                 _flush_buffer(
-                    buffer_chunks,
+                    audio_buffer.drain(),
                     active_sample_rate,
                     active_channels,
                     segments_dir,
                     merged,
                     segment_index,
-                    raw_transcript_path,
+                    raw_transcript,
                     dashboard,
                 )
 
         finally:
+            if raw_transcript is not None:
+                raw_transcript.close()
             capture.stop()
             if dashboard:
                 dashboard.set_status("stopped")
@@ -203,6 +243,7 @@ def run_output_capture(
     _backup_existing_dir(segments_dir)
 
     segments_dir.mkdir(parents=True, exist_ok=True)
+    _boost_capture_thread()
 
     capture = open_output_capture(
         live_config["backend"],
@@ -212,7 +253,8 @@ def run_output_capture(
         audio_config["chunk_ms"],
     )
 
-    buffer_chunks: list[bytes] = []
+    release = getattr(capture, "release", None)
+    audio_buffer: _RingBuffer | None = None
     buffer_ms = 0.0
     silence_ms = 0.0
     speech_ms = 0.0
@@ -229,130 +271,142 @@ def run_output_capture(
         audio_config["chunk_ms"],
     )
 
+    raw_transcript: TextIO | None = None
     capture.start()
+    stop_requested = stop_event.is_set
     try:
-        while not stop_event.is_set():
-            chunk = capture.read(timeout=0.25)
-            if chunk is None:
-                continue
-            active_sample_rate = chunk.sample_rate
-            active_channels = chunk.channels
-            chunk_duration = _chunk_duration_ms(chunk)
-            buffer_chunks.append(chunk.data)
-            buffer_ms += chunk_duration
-
-            if vad_config["enabled"]:
-                energy = _rms_energy(chunk.data)
-                if energy < vad_config["energy_threshold"]:
-                    silence_ms += chunk_duration
-                else:
-                    silence_ms = 0.0
-                    speech_ms += chunk_duration
+        raw_transcript = raw_transcript_path.open("a", encoding="utf-8", buffering=1)
+        while not stop_requested():
+            for chunk in _drain(capture, timeout=0.25):
+                active_sample_rate = chunk.sample_rate
+                active_channels = chunk.channels
+                chunk_duration = _chunk_duration_ms(chunk)
+                energy = _rms_energy(chunk.data) if vad_config["enabled"] else 0.0
+                if audio_buffer is None:
+                    audio_buffer = _RingBuffer(
+                        _ms_to_bytes(
+                            vad_config["max_buffer_ms"],
+                            chunk.sample_rate,
+                            chunk.channels,
+                        )
+                        + len(chunk.data)
+                    )
+                audio_buffer.write(chunk.data)
+                if release is not None:
+                    release(chunk.data)
+                buffer_ms = _buffer_duration_ms(
+                    len(audio_buffer), chunk.sample_rate, chunk.channels
+                )
+
+                if vad_config["enabled"]:
+                    if energy < vad_config["energy_threshold"]:
+                        silence_ms += chunk_duration
+                    else:
+                        silence_ms = 0.0
+                        speech_ms += chunk_duration
+
+                    if buffer_ms >= vad_config["max_buffer_ms"]:
+                        if speech_ms >= vad_config["min_speech_ms"]:
+                            segment_index = _flush_buffer(
+                                audio_buffer.drain(),
+                                chunk.sample_rate,
+                                chunk.channels,
+                                segments_dir,
+                                merged,
+                                segment_index,
+                                raw_transcript,
+                                dashboard,
+                                output_mode=True,
+                            )
+                            logger.info(
+                                "Flushed output segment %s (max buffer)", segment_index
+                            )
+                            buffer_ms = 0.0
+                            silence_ms = 0.0
+                            speech_ms = 0.0
+                            continue
+                        buffer_ms = _trim_buffer(
+                            audio_buffer,
+                            vad_config["max_buffer_ms"],
+                            chunk.sample_rate,
+                            chunk.channels,
+                        )
 
-                if buffer_ms >= vad_config["max_buffer_ms"]:
-                    if speech_ms >= vad_config["min_speech_ms"]:
+                    if (
+                        silence_ms >= vad_config["silence_ms"]
+                        and speech_ms >= vad_config["min_speech_ms"]
+                    ):
                         segment_index = _flush_buffer(
-                            buffer_chunks,
+                            audio_buffer.drain(),
                             chunk.sample_rate,
                             chunk.channels,
                             segments_dir,
                             merged,
                             segment_index,
-                            raw_transcript_path,
+                            raw_transcript,
                             dashboard,
                             output_mode=True,
                         )
-                        logger.info(
-                            "Flushed output segment %s (max buffer)", segment_index
+
+                        logger.info("Flushed output segment %s", segment_index)
+                        buffer_ms = 0.0
+                        silence_ms = 0.0
+                        speech_ms = 0.0
+                else:
+                    if buffer_ms >= vad_config["max_buffer_ms"]:
+                        segment_index = _flush_buffer(
+                            audio_buffer.drain(),
+                            chunk.sample_rate,
+                            chunk.channels,
+                            segments_dir,
+                            merged,
+                            segment_index,
+                            raw_transcript,
+                            dashboard,
+                            output_mode=True,
                         )
-                        buffer_chunks = []
+                        logger.info("Flushed output segment %s", segment_index)
                         buffer_ms = 0.0
                         silence_ms = 0.0
                         speech_ms = 0.0
-                        continue
-                    buffer_chunks, buffer_ms = _trim_buffer(
-                        buffer_chunks,
-                        buffer_ms,
-                        vad_config["max_buffer_ms"],
-                        chunk.sample_rate,
-                        chunk.channels,
-                    )
-
-                if (
-                    silence_ms >= vad_config["silence_ms"]
-                    and speech_ms >= vad_config["min_speech_ms"]
-                ):
-                    segment_index = _flush_buffer(
-                        buffer_chunks,
-                        chunk.sample_rate,
-                        chunk.channels,
-                        segments_dir,
-                        merged,
-                        segment_index,
-                        raw_transcript_path,
-                        dashboard,
-                        output_mode=True,
-                    )
-
-                    logger.info("Flushed output segment %s", segment_index)
-                    buffer_chunks = []
-                    buffer_ms = 0.0
-                    silence_ms = 0.0
-                    speech_ms = 0.0
-            else:
-                if buffer_ms >= vad_config["max_buffer_ms"]:
-                    segment_index = _flush_buffer(
-                        buffer_chunks,
-                        chunk.sample_rate,
-                        chunk.channels,
-                        segments_dir,
-                        merged,
-                        segment_index,
-                        raw_transcript_path,
-                        dashboard,
-                        output_mode=True,
-                    )
-                    logger.info("Flushed output segment %s", segment_index)
-                    buffer_chunks = []
-                    buffer_ms = 0.0
-                    silence_ms = 0.0
-                    speech_ms = 0.0
     finally:
         try:
-            should_flush = buffer_chunks and (
+            should_flush = audio_buffer and (
                 not vad_config["enabled"] or speech_ms >= vad_config["min_speech_ms"]
             )
             if should_flush:
                 _flush_buffer(
-                    buffer_chunks,
+                    audio_buffer.drain(),
                     active_sample_rate,
                     active_channels,
                     segments_dir,
                     merged,
                     segment_index,
-                    raw_transcript_path,
+                    raw_transcript,
                     dashboard,
                     output_mode=True,
                 )
 
         finally:
+            if raw_transcript is not None:
+                raw_transcript.close()
             capture.stop()
             logger.info("Output capture stopped.")
 
 
 def _flush_buffer(
-    buffer_chunks: list[bytes],
+    audio: bytes,
     sample_rate: int,
     channels: int,
     segments_dir: Path,
     config: dict[str, Any],
     segment_index: int,
-    raw_transcript_path: Path,
+    raw_transcript: TextIO,
     dashboard: LiveDashboard | None,
     *,
     output_mode: bool = False,
 ) -> int:
-    if not buffer_chunks:
+    if not audio:
         return segment_index
 
     segment_index += 1
@@ -366,39 +420,41 @@ def _flush_buffer(
         "task": config["task"],
     }
 
-    segment_audio_ms = _buffer_duration_ms(buffer_chunks, sample_rate, channels)
+    segment_audio_ms = _buffer_duration_ms(len(audio), sample_rate, channels)
     if dashboard:
         if output_mode:
             dashboard.output_segment_started(segment_index, segment_audio_ms)
         else:
             dashboard.segment_started(segment_index, segment_audio_ms)
 
-    _write_wav(wav_path, buffer_chunks, sample_rate, channels)
+    _write_wav(wav_path, audio, sample_rate, channels)
     start_time = time.perf_counter()
     try:
-        output_files = run_transcribe(str(wav_path), config, output_overrides)
+        with _unboosted():
+            output_files = run_transcribe(str(wav_path), config, output_overrides)
     except WhisperflowRuntimeError as exc:
         elapsed_ms = (time.perf_counter() - start_time) * 1000.0
         logger.warning("Live transcription failed for %s: %s", wav_path, exc)
-        _append_line(raw_transcript_path, f"[transcription failed: {exc}]")
+        _append_line(raw_transcript, f"[transcription failed: {exc}]")
         if dashboard:
-            if output_mode:
-                dashboard.output_mark_error(str(exc))
-                dashboard.output_segment_finished(
-                    segment_index, segment_audio_ms, elapsed_ms, False, ""
-                )
-            else:
-                dashboard.mark_error(str(exc))
-                dashboard.segment_finished(
-                    segment_index, segment_audio_ms, elapsed_ms, False, ""
-                )
+            with dashboard.batch():
+                if output_mode:
+                    dashboard.output_mark_error(str(exc))
+                    dashboard.output_segment_finished(
+                        segment_index, segment_audio_ms, elapsed_ms, False, ""
+                    )
+                else:
+                    dashboard.mark_error(str(exc))
+                    dashboard.segment_finished(
+                        segment_index, segment_audio_ms, elapsed_ms, False, ""
+                    )
         return segment_index
 
     elapsed_ms = (time.perf_counter() - start_time) * 1000.0
     transcript_text = _read_transcript(output_files)
     preview = _preview_transcript(transcript_text)
     if transcript_text:
-        _append_line(raw_transcript_path, transcript_text.strip())
+        _append_line(raw_transcript, transcript_text.strip())
         if dashboard:
             dashboard.append_transcript(transcript_text, output_mode=output_mode)
     if dashboard:
@@ -413,45 +469,172 @@ def _flush_buffer(
     return segment_index
 
 
-def _write_wav(
-    path: Path, buffer_chunks: list[bytes], sample_rate: int, channels: int
-) -> None:
-    data = b"".join(buffer_chunks)
+def _write_wav(path: Path, audio: bytes, sample_rate: int, channels: int) -> None:
     with wave.open(str(path), "wb") as handle:
         handle.setnchannels(channels)
         handle.setsampwidth(2)
         handle.setframerate(sample_rate)
-        handle.writeframes(data)
+        handle.writeframes(audio)
 
 
-def _read_transcript(output_files: list[str]) -> str:
-    if not output_files:
-        return ""
-    path = Path(output_files[0])
+def _boost_capture_thread() -> None:
+    """Best-effort raise of the calling capture thread's scheduling priority.
+
+    On Linux both calls apply to the calling thread only. Raising priority needs
+    CAP_SYS_NICE, and pinning is opt-in via ``WHISPERFLOW_CAPTURE_CPU``. The
+    original settings are remembered for ``_unboosted``.
+    """
+    state = _BOOST_STATE
+    state.niceness = None
+    state.affinity = None
+    state.pinned = None
     try:
-        return path.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        return ""
+        original_niceness = os.getpriority(os.PRIO_PROCESS, 0)
+        os.setpriority(os.PRIO_PROCESS, 0, _CAPTURE_NICENESS)
+    except (AttributeError, OSError) as exc:
+        logger.debug("Could not raise capture thread priority: %s", exc)
+    else:
+        state.niceness = original_niceness
+    cpu = os.environ.get("WHISPERFLOW_CAPTURE_CPU")
+    if not cpu:
+        return
+    try:
+        pinned = {int(cpu)}
+        original_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, pinned)
+    except (AttributeError, OSError, ValueError) as exc:
+        logger.debug("Could not pin capture thread to CPU %s: %s", cpu, exc)
+    else:
+        state.affinity = original_affinity
+        state.pinned = pinned
+
+
+@contextmanager
+def _unboosted() -> Iterator[None]:
+    """Run the block with the thread's pre-boost priority and CPU affinity.
+
+    Child processes inherit both, so the transcription subprocess would
+    otherwise be niced and confined to the capture CPU.
+    """
+    niceness = getattr(_BOOST_STATE, "niceness", None)
+    affinity = getattr(_BOOST_STATE, "affinity", None)
+    if niceness is not None:
+        _set_niceness(niceness)
+    if affinity is not None:
+        _set_affinity(affinity)
+    try:
+        yield
+    finally:
+        if niceness is not None:
+            _set_niceness(_CAPTURE_NICENESS)
+        if affinity is not None:
+            _set_affinity(_BOOST_STATE.pinned)
+
+
+def _set_niceness(niceness: int) -> None:
+    try:
+        os.setpriority(os.PRIO_PROCESS, 0, niceness)
+    except OSError as exc:
+        logger.debug("Could not set capture thread priority: %s", exc)
+
+
+def _set_affinity(cpus: set[int]) -> None:
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as exc:
+        logger.debug("Could not set capture thread CPU affinity: %s", exc)
+
+
+def _drain(
+    capture: Any, timeout: float, max_batch: int = _MAX_DRAIN_BATCH
+) -> list[AudioChunk]:
+    """Wait for one chunk, then take whatever else is already queued."""
+    chunk = capture.read(timeout=timeout)
+    if chunk is None:
+        return []
+    chunks = [chunk]
+    while len(chunks) < max_batch:
+        chunk = capture.read(timeout=0)
+        if chunk is None:
+            break
+        chunks.append(chunk)
+    return chunks
 
 
-def _append_line(path: Path, text: str) -> None:
+def _read_transcript(output_files: list[str]) -> str:
+    parts: list[str] = []
+    for output_file in output_files:
+        try:
+            parts.append(Path(output_file).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            continue
+    return "".join(parts)
+
+
+def _append_line(handle: TextIO, text: str) -> None:
     timestamp = _now_iso()
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(f"{timestamp} {text}\n")
+    handle.write(f"{timestamp} {text}\n")
 
 
 def _now_iso() -> str:
-    return (
-        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return _format_ts(datetime.now(timezone.utc))
+
+
+def _format_ts(now: datetime) -> str:
+    """Format a UTC datetime as ``YYYY-MM-DDTHH:MM:SSZ``, reusing it within a second."""
+    global _LAST_TIMESTAMP
+    second = int(now.timestamp())
+    cached = _LAST_TIMESTAMP
+    if cached[0] == second:
+        return cached[1]
+    text = (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        f"T{now.hour:02d}:{now.minute:02d}:{now.second:02d}Z"
     )
+    _LAST_TIMESTAMP = (second, text)
+    return text
+
+
+if njit is not None and _HAS_NUMPY:
 
+    @njit(cache=True, fastmath=True)
+    def _sum_squares(samples):  # noqa: ANN001, ANN202
+        total = 0.0
+        for index in range(samples.shape[0]):
+            value = float(samples[index])
+            total += value * value
+        return total
 
-def _rms_energy(data: bytes) -> float:
-    samples = array("h")
-    samples.frombytes(data)
-    if not samples:
+else:
+    _sum_squares = None
+
+
+def _is_digital_silence(data: bytes | memoryview) -> bool:
+    """Return whether ``data`` is all zero bytes, via one memcmp against a cache."""
+    size = len(data)
+    zeros = _SILENCE_CACHE.get(size)
+    if zeros is None:
+        if len(_SILENCE_CACHE) >= _SILENCE_CACHE_SIZE:
+            _SILENCE_CACHE.clear()
+        zeros = _SILENCE_CACHE[size] = bytes(size)
+    return zeros.startswith(data)
+
+
+def _rms_energy(data: bytes | memoryview) -> float:
+    # A trailing odd byte is not a whole sample; drop it once so every path below
+    # sees the same samples.
+    view = memoryview(data)
+    view = view[: len(view) & ~1]
+    if not view or _is_digital_silence(view):
         return 0.0
-    total = sum(sample * sample for sample in samples)
+    if _sum_squares is not None:
+        values = np.frombuffer(view, dtype=_PCM16)
+        return math.sqrt(_sum_squares(values) / values.shape[0]) / 32768.0
+    if _HAS_NUMPY:
+        values = np.frombuffer(view, dtype=_PCM16).astype(np.float32)
+        return math.sqrt(float(np.dot(values, values)) / values.shape[0]) / 32768.0
+    samples = view.cast("h")
+    total = sum(map(operator.mul, samples, samples))
     mean_square = total / len(samples)
     return math.sqrt(mean_square) / 32768.0
 
@@ -462,11 +645,8 @@ def _chunk_duration_ms(chunk: AudioChunk) -> float:
     return (frame_count / chunk.sample_rate) * 1000.0
 
 
-def _buffer_duration_ms(
-    buffer_chunks: list[bytes], sample_rate: int, channels: int
-) -> float:
+def _buffer_duration_ms(total_bytes: int, sample_rate: int, channels: int) -> float:
     bytes_per_sample = 2
-    total_bytes = sum(len(chunk) for chunk in buffer_chunks)
     frame_count = total_bytes / (bytes_per_sample * channels)
     return (frame_count / sample_rate) * 1000.0
 
@@ -479,7 +659,7 @@ def _preview_transcript(text: str, limit: int = 120) -> str:
 
 
 def _backup_existing_file(path: Path) -> None:
-    if not path.exists() or not path.is_file():
+    if not path.is_file():
         return
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     backup_path = path.with_name(f"{path.name}.{timestamp}.bak")
@@ -487,12 +667,12 @@ def _backup_existing_file(path: Path) -> None:
     while backup_path.exists():
         backup_path = path.with_name(f"{path.name}.{timestamp}.{counter}.bak")
         counter += 1
-    path.rename(backup_path)
+    os.replace(path, backup_path)
     logger.info("Backed up %s to %s", path, backup_path)
 
 
 def _backup_existing_dir(path: Path) -> None:
-    if not path.exists() or not path.is_dir():
+    if not path.is_dir():
         return
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     backup_path = path.with_name(f"{path.name}.{timestamp}.bak")
@@ -504,19 +684,69 @@ def _backup_existing_dir(path: Path) -> None:
     logger.info("Backed up %s to %s", path, backup_path)
 
 
+def _ms_to_bytes(duration_ms: float, sample_rate: int, channels: int) -> int:
+    bytes_per_sample = 2
+    frame_count = math.ceil(duration_ms * sample_rate / 1000.0)
+    return frame_count * channels * bytes_per_sample
+
+
 def _trim_buffer(
-    buffer_chunks: list[bytes],
-    buffer_ms: float,
+    audio_buffer: _RingBuffer,
     max_buffer_ms: int,
     sample_rate: int,
     channels: int,
-) -> tuple[list[bytes], float]:
-    bytes_per_sample = 2
-    bytes_per_ms = (sample_rate * channels * bytes_per_sample) / 1000.0
-    while buffer_chunks and buffer_ms > max_buffer_ms:
-        removed = buffer_chunks.pop(0)
-        buffer_ms -= len(removed) / bytes_per_ms
-    return buffer_chunks, buffer_ms
+) -> float:
+    max_bytes = _ms_to_bytes(max_buffer_ms, sample_rate, channels)
+    if len(audio_buffer) > max_bytes:
+        audio_buffer.discard_oldest(len(audio_buffer) - max_bytes)
+    return _buffer_duration_ms(len(audio_buffer), sample_rate, channels)
+
+
+class _RingBuffer:
+    """Fixed-capacity byte ring holding the newest audio of the pending segment.
+
+    Writes copy into a preallocated buffer and overwrite the oldest bytes once it
+    is full; the audio is only copied out contiguously when the segment flushes.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._view = memoryview(bytearray(capacity))
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, data: bytes | memoryview) -> None:
+        count = len(data)
+        capacity = self._capacity
+        if count >= capacity:
+            self._view[:] = data[count - capacity :]
+            self._head = 0
+            self._size = capacity
+            return
+        head = self._head
+        first = min(count, capacity - head)
+        self._view[head : head + first] = data[:first]
+        if first < count:
+            self._view[: count - first] = data[first:]
+        self._head = (head + count) % capacity
+        self._size = min(self._size + count, capacity)
+
+    def discard_oldest(self, count: int) -> None:
+        self._size -= min(count, self._size)
+
+    def drain(self) -> bytes:
+        start = (self._head - self._size) % self._capacity
+        end = start + self._size
+        if end <= self._capacity:
+            audio = self._view[start:end].tobytes()
+        else:
+            audio = b"".join((self._view[start:], self._view[: end - self._capacity]))
+        self._head = 0
+        self._size = 0
+        return audio
 
 
 __all__ = ["run_live_capture", "run_output_capture"]
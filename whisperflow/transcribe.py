@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import stat
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -14,26 +16,32 @@ from whisperflow.errors import WhisperflowRuntimeError, UserInputError
 EXECUTABLE_PATH = Path("/usr/local/bin/faster-whisper-gpu")
 logger = logging.getLogger(__name__)
 
-SUPPORTED_AUDIO_EXTENSIONS = {
-    ".wav",
-    ".mp3",
-    ".m4a",
-    ".flac",
-    ".ogg",
-    ".opus",
-    ".aac",
-    ".wma",
-    ".webm",
-    ".mp4",
-}
+# Executables that already passed validation, keyed by path -> (mtime_ns, mode).
+_EXECUTABLE_CACHE: dict[Path, tuple[int, int]] = {}
+
+SUPPORTED_AUDIO_EXTENSIONS = frozenset(
+    {
+        ".wav",
+        ".mp3",
+        ".m4a",
+        ".flac",
+        ".ogg",
+        ".opus",
+        ".aac",
+        ".wma",
+        ".webm",
+        ".mp4",
+    }
+)
 
 
 def run_transcribe(input_path: str, config: dict[str, Any], overrides: dict[str, Any]) -> list[str]:
     """Transcribe a single audio file using faster-whisper-gpu."""
     audio_path = Path(input_path)
-    if not audio_path.exists():
+    audio_mode = _stat_mode(audio_path)
+    if audio_mode is None:
         raise UserInputError(f"Input file not found: {audio_path}")
-    if audio_path.is_dir():
+    if stat.S_ISDIR(audio_mode):
         raise UserInputError(f"Input path is a directory: {audio_path}")
     if audio_path.suffix.lower() not in SUPPORTED_AUDIO_EXTENSIONS:
         supported = ", ".join(sorted(SUPPORTED_AUDIO_EXTENSIONS))
@@ -43,53 +51,89 @@ def run_transcribe(input_path: str, config: dict[str, Any], overrides: dict[str,
 
     merged = apply_overrides(config, overrides)
     output_dir = Path(merged["output_dir"])
-    if output_dir.exists() and not output_dir.is_dir():
+    output_mode = _stat_mode(output_dir)
+    if output_mode is None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    elif not stat.S_ISDIR(output_mode):
         raise UserInputError(f"Output directory path is not a directory: {output_dir}")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_format = merged["output_format"]
+    output_file = output_dir / f"{audio_path.stem}.{output_format}"
 
-    if not EXECUTABLE_PATH.exists():
-        raise WhisperflowRuntimeError(f"faster-whisper-gpu executable not found at {EXECUTABLE_PATH}.")
-    if not EXECUTABLE_PATH.is_file():
-        raise WhisperflowRuntimeError(f"faster-whisper-gpu path is not a file: {EXECUTABLE_PATH}.")
-    if not os.access(EXECUTABLE_PATH, os.X_OK):
-        raise WhisperflowRuntimeError(f"faster-whisper-gpu is not executable: {EXECUTABLE_PATH}.")
+    _validate_executable(EXECUTABLE_PATH)
 
-    command = [
-        str(EXECUTABLE_PATH),
-        "--model",
-        merged["model"],
-    ]
     logger.info(
         "Transcribing %s (model=%s task=%s output_format=%s output_dir=%s).",
         audio_path,
         merged["model"],
         merged["task"],
-        merged["output_format"],
+        output_format,
         output_dir,
     )
+    command = list(
+        _command_prefix(
+            EXECUTABLE_PATH, merged["model"], merged["task"], output_format, output_dir
+        )
+    )
     language = merged["language"].strip().lower()
     if language != "auto":
-        command.extend(["--language", merged["language"]])
-    command.extend(
-        [
-            "--task",
-            merged["task"],
-            "--output_format",
-            merged["output_format"],
-            "--output_dir",
-            str(output_dir),
-            str(audio_path),
-        ]
-    )
+        command += ["--language", merged["language"]]
+    command.append(str(audio_path))
 
-    result = subprocess.run(command, capture_output=True, text=True, check=False)
+    result = subprocess.run(
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+    )
     if result.returncode != 0:
-        stderr = result.stderr.strip() or "Unknown error."
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        stderr = stderr or "Unknown error."
         raise WhisperflowRuntimeError(f"Transcription failed for {audio_path}: {stderr}")
 
-    output_file = output_dir / f"{audio_path.stem}.{merged['output_format']}"
     logger.info("Transcription complete: %s", output_file)
     return [str(output_file)]
 
 
+@functools.lru_cache(maxsize=16)
+def _command_prefix(
+    executable: Path, model: str, task: str, output_format: str, output_dir: Path
+) -> tuple[str, ...]:
+    """Return the argv shared by every run with the same model and output settings."""
+    return (
+        str(executable),
+        "--model",
+        model,
+        "--task",
+        task,
+        "--output_format",
+        output_format,
+        "--output_dir",
+        str(output_dir),
+    )
+
+
+def _stat_mode(path: Path) -> int | None:
+    """Return ``st_mode`` for ``path`` from a single stat call, or None if missing."""
+    info = _stat(path)
+    return None if info is None else info.st_mode
+
+
+def _stat(path: Path) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _validate_executable(path: Path) -> None:
+    info = _stat(path)
+    if info is None:
+        raise WhisperflowRuntimeError(f"faster-whisper-gpu executable not found at {path}.")
+    signature = (info.st_mtime_ns, info.st_mode)
+    if _EXECUTABLE_CACHE.get(path) == signature:
+        return
+    if not stat.S_ISREG(info.st_mode):
+        raise WhisperflowRuntimeError(f"faster-whisper-gpu path is not a file: {path}.")
+    if not os.access(path, os.X_OK):
+        raise WhisperflowRuntimeError(f"faster-whisper-gpu is not executable: {path}.")
+    _EXECUTABLE_CACHE[path] = signature
+
+
 __all__ = ["run_transcribe"]
@@ -6,13 +6,27 @@ import json
 import queue
 import threading
 from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Deque
+from typing import Any, Deque, Iterator
 from urllib.parse import urlparse
 
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+
+    def _dumps(payload: Any) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+_LISTENER_BACKLOG = 64
+_HEARTBEAT_INTERVAL_S = 0.5
+# Marker payloads queued by the shared heartbeat thread; compared by identity.
+_HEARTBEAT: dict[str, Any] = {}
+_CLOSED: dict[str, Any] = {}
+
 
 @dataclass(frozen=True)
 class SegmentMetrics:
@@ -27,12 +41,42 @@ class SegmentMetrics:
     preview: str
 
 
+class _Listener:
+    """Bounded per-client event buffer woken through the dashboard's condition."""
+
+    def __init__(self, condition: threading.Condition, maxlen: int) -> None:
+        self._condition = condition
+        self._items: Deque[dict[str, Any]] = deque(maxlen=maxlen)
+
+    def get(self, timeout: float | None = None) -> dict[str, Any]:
+        """Return the oldest pending payload, raising ``queue.Empty`` on timeout."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._items, timeout):
+                raise queue.Empty
+            return self._items.popleft()
+
+    def put(self, item: dict[str, Any]) -> None:
+        """Queue ``item``, dropping the oldest when full.
+
+        The caller must hold the shared condition and notify it afterwards.
+        """
+        self._items.append(item)
+
+    def is_idle(self) -> bool:
+        """Return whether nothing is queued; the caller must hold the condition."""
+        return not self._items
+
+
 class LiveDashboard:
     """Collect and broadcast live transcription stats."""
 
     def __init__(self, config: dict[str, Any], *, history_limit: int = 20) -> None:
         self._lock = threading.Lock()
-        self._queues: list[queue.Queue[dict[str, Any]]] = []
+        self._version = 0
+        self._cached_json: tuple[int, bytes] | None = None
+        self._batch_state = threading.local()
+        self._listeners_changed = threading.Condition()
+        self._listeners: list[_Listener] = []
         self._segments: Deque[SegmentMetrics] = deque(maxlen=history_limit)
         self._output_segments: Deque[SegmentMetrics] = deque(maxlen=history_limit)
         self._status = "starting"
@@ -58,22 +102,26 @@ class LiveDashboard:
 
     def set_status(self, status: str) -> None:
         with self._lock:
+            self._version += 1
             self._status = status
         self.publish_snapshot()
 
     def mark_error(self, message: str) -> None:
         with self._lock:
+            self._version += 1
             self._last_error = message
         self.publish_snapshot()
 
     def output_mark_error(self, message: str) -> None:
         with self._lock:
+            self._version += 1
             self._output_last_error = message
         self.publish_snapshot()
 
     def segment_started(self, index: int, audio_ms: float) -> None:
         started_at = _now_iso()
         with self._lock:
+            self._version += 1
             self._status = "transcribing"
             self._current_segment = {
                 "index": index,
@@ -85,6 +133,7 @@ class LiveDashboard:
     def output_segment_started(self, index: int, audio_ms: float) -> None:
         started_at = _now_iso()
         with self._lock:
+            self._version += 1
             self._output_current_segment = {
                 "index": index,
                 "audio_ms": round(audio_ms, 2),
@@ -118,6 +167,7 @@ class LiveDashboard:
         )
 
         with self._lock:
+            self._version += 1
             self._segments_total += 1
             self._total_audio_ms += audio_ms
             self._total_transcribe_ms += transcribe_ms
@@ -155,6 +205,7 @@ class LiveDashboard:
         )
 
         with self._lock:
+            self._version += 1
             self._output_segments_total += 1
             self._output_total_audio_ms += audio_ms
             self._output_total_transcribe_ms += transcribe_ms
@@ -170,26 +221,73 @@ class LiveDashboard:
         if not cleaned:
             return
         with self._lock:
+            self._version += 1
             if output_mode:
                 self._output_transcript.append(cleaned)
             else:
                 self._live_transcript.append(cleaned)
 
-    def register_listener(self) -> queue.Queue[dict[str, Any]]:
-        listener: queue.Queue[dict[str, Any]] = queue.Queue()
-        with self._lock:
-            self._queues.append(listener)
+    def register_listener(self) -> _Listener:
+        listener = _Listener(self._listeners_changed, _LISTENER_BACKLOG)
+        with self._listeners_changed:
+            self._listeners.append(listener)
         return listener
 
-    def unregister_listener(self, listener: queue.Queue[dict[str, Any]]) -> None:
-        with self._lock:
-            if listener in self._queues:
-                self._queues.remove(listener)
+    def unregister_listener(self, listener: _Listener) -> None:
+        with self._listeners_changed:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def send_heartbeat(self) -> None:
+        """Wake idle listeners so their connections emit a keep-alive comment."""
+        with self._listeners_changed:
+            idle = [listener for listener in self._listeners if listener.is_idle()]
+            for listener in idle:
+                listener.put(_HEARTBEAT)
+            if idle:
+                self._listeners_changed.notify_all()
+
+    def close_listeners(self) -> None:
+        """Tell every connected listener that the stream is over."""
+        with self._listeners_changed:
+            for listener in self._listeners:
+                listener.put(_CLOSED)
+            self._listeners_changed.notify_all()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce the snapshots this thread publishes into one broadcast on exit."""
+        state = self._batch_state
+        depth = getattr(state, "depth", 0)
+        state.depth = depth + 1
+        try:
+            yield
+        finally:
+            state.depth = depth
+            if depth == 0 and getattr(state, "pending", False):
+                state.pending = False
+                self.publish_snapshot()
 
     def publish_snapshot(self) -> None:
+        state = self._batch_state
+        if getattr(state, "depth", 0):
+            state.pending = True
+            return
         snapshot = self.snapshot()
         self._broadcast(snapshot)
 
+    def snapshot_json(self) -> bytes:
+        """Return the encoded snapshot, re-encoding only after state changes."""
+        with self._lock:
+            version = self._version
+            cached = self._cached_json
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        payload = _dumps(self.snapshot())
+        with self._lock:
+            self._cached_json = (version, payload)
+        return payload
+
     def snapshot(self) -> dict[str, Any]:
         with self._lock:
             total_audio_s = self._total_audio_ms / 1000.0
@@ -246,10 +344,12 @@ class LiveDashboard:
             }
 
     def _broadcast(self, payload: dict[str, Any]) -> None:
-        with self._lock:
-            listeners = list(self._queues)
-        for listener in listeners:
-            listener.put(payload)
+        with self._listeners_changed:
+            if not self._listeners:
+                return
+            for listener in self._listeners:
+                listener.put(payload)
+            self._listeners_changed.notify_all()
 
 
 DASHBOARD_HTML = """<!doctype html>
@@ -661,10 +761,17 @@ DASHBOARD_HTML = """<!doctype html>
 </html>
 """
 
+_DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_HTML_LENGTH = str(len(_DASHBOARD_HTML_BYTES))
+
 
 class DashboardRequestHandler(BaseHTTPRequestHandler):
     """Serve the dashboard HTML and SSE stats stream."""
 
+    # Keep-alive lets pollers reuse one connection; every fixed-size response
+    # carries Content-Length and the event stream closes its connection.
+    protocol_version = "HTTP/1.1"
+
     def __init__(
         self,
         *args: Any,
@@ -693,15 +800,14 @@ class DashboardRequestHandler(BaseHTTPRequestHandler):
         return
 
     def _handle_index(self) -> None:
-        payload = DASHBOARD_HTML.encode("utf-8")
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Content-Length", _DASHBOARD_HTML_LENGTH)
         self.end_headers()
-        self.wfile.write(payload)
+        self.wfile.write(_DASHBOARD_HTML_BYTES)
 
     def _handle_stats(self) -> None:
-        payload = json.dumps(self._dashboard.snapshot()).encode("utf-8")
+        payload = self._dashboard.snapshot_json()
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(payload)))
@@ -712,16 +818,21 @@ class DashboardRequestHandler(BaseHTTPRequestHandler):
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", "text/event-stream")
         self.send_header("Cache-Control", "no-cache")
-        self.send_header("Connection", "keep-alive")
+        self.send_header("Connection", "close")
         self.end_headers()
+        self.close_connection = True
 
         listener = self._dashboard.register_listener()
         try:
             self._send_event(self._dashboard.snapshot())
             while not self._stop_event.is_set():
                 try:
-                    payload = listener.get(timeout=0.5)
+                    payload = listener.get(timeout=_HEARTBEAT_INTERVAL_S * 4)
                 except queue.Empty:
+                    continue
+                if payload is _CLOSED:
+                    break
+                if payload is _HEARTBEAT:
                     self._send_comment("heartbeat")
                     continue
                 self._send_event(payload)
@@ -742,6 +853,14 @@ class DashboardRequestHandler(BaseHTTPRequestHandler):
         self.wfile.flush()
 
 
+class _DashboardServer(ThreadingHTTPServer):
+    """Threaded server sized for many concurrent SSE and /stats clients."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
 def start_dashboard_server(
     dashboard: LiveDashboard,
     stop_event: threading.Event,
@@ -755,7 +874,7 @@ def start_dashboard_server(
             *args, dashboard=dashboard, stop_event=stop_event, **kwargs
         )
 
-    server = ThreadingHTTPServer((host, port), handler_factory)
+    server = _DashboardServer((host, port), handler_factory)
 
     thread = threading.Thread(
         target=server.serve_forever, name="whisperflow-dashboard", daemon=True
@@ -771,6 +890,16 @@ def start_dashboard_server(
     )
     stopper.start()
 
+    def send_heartbeats() -> None:
+        while not stop_event.wait(_HEARTBEAT_INTERVAL_S):
+            dashboard.send_heartbeat()
+        dashboard.close_listeners()
+
+    heartbeat = threading.Thread(
+        target=send_heartbeats, name="whisperflow-dashboard-heartbeat", daemon=True
+    )
+    heartbeat.start()
+
     return server
 
 